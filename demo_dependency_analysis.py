@@ -20,11 +20,10 @@ def print_section(title: str):
     print(f"{'='*80}\n")
 
 
-def demo_basic_dependency_analysis():
+def demo_basic_dependency_analysis(translator: NLToSQLTranslator):
     """Demonstrate basic dependency tree analysis."""
     print_section("Basic Dependency Tree Analysis")
-    
-    translator = NLToSQLTranslator()
+
     query = "Show me all assets affected by CVE-2025-10501 in site 54"
     
     print(f"Query: {query}\n")
@@ -32,34 +31,37 @@ def demo_basic_dependency_analysis():
     # Get dependency tree information
     tree = translator.analyze_dependency_tree(query)
     
-    print("Token Analysis:")
-    print("-" * 80)
-    print(f"{'Token':<15} {'Lemma':<15} {'POS':<8} {'Tag':<8} {'Dep':<12} {'Head':<15}")
-    print("-" * 80)
+    # Collect the report and print it in one go rather than line by line
+    lines = [
+        "Token Analysis:",
+        "-" * 80,
+        f"{'Token':<15} {'Lemma':<15} {'POS':<8} {'Tag':<8} {'Dep':<12} {'Head':<15}",
+        "-" * 80,
+    ]
     
     for token in tree["tokens"]:
-        print(
+        lines.append(
             f"{token['text']:<15} {token['lemma']:<15} {token['pos']:<8} "
             f"{token['tag']:<8} {token['dep']:<12} {token['head']:<15}"
         )
     
-    print("\n\nDependency Relationships:")
-    print("-" * 80)
+    lines.append("\n\nDependency Relationships:")
+    lines.append("-" * 80)
     for dep in tree["dependencies"]:
-        print(f"  {dep['token']:15} --[{dep['dep']}]--> {dep['head']}")
+        lines.append(f"  {dep['token']:15} --[{dep['dep']}]--> {dep['head']}")
     
-    print("\n\nNoun Chunks:")
-    print("-" * 80)
+    lines.append("\n\nNoun Chunks:")
+    lines.append("-" * 80)
     for chunk in tree["noun_chunks"]:
-        print(f"  '{chunk['text']}' (root: {chunk['root']}, dep: {chunk['dep']})")
+        lines.append(f"  '{chunk['text']}' (root: {chunk['root']}, dep: {chunk['dep']})")
+
+    print("\n".join(lines))
 
 
-def demo_cve_recognition():
+def demo_cve_recognition(translator: NLToSQLTranslator):
     """Demonstrate CVE pattern recognition."""
     print_section("CVE Pattern Recognition")
     
-    translator = NLToSQLTranslator()
-    
     queries = [
         "Show me all assets affected by CVE-2025-10501",
         "Find assets vulnerable to CVE-2017-12819 in site 54",
@@ -78,12 +80,10 @@ def demo_cve_recognition():
             print(f"Recognized CVEs: {[v['value'] for v in cve_values]}")
 
 
-def demo_ip_recognition():
+def demo_ip_recognition(translator: NLToSQLTranslator):
     """Demonstrate IP address pattern recognition."""
     print_section("IP Address Pattern Recognition")
     
-    translator = NLToSQLTranslator()
-    
     queries = [
         "Find all information about IP 10.89.46.34",
         "Show me assets with IP starting with 10.89",
@@ -102,11 +102,10 @@ def demo_ip_recognition():
             print(f"Recognized IPs: {[v['value'] for v in ip_values]}")
 
 
-def demo_semantic_relationships():
+def demo_semantic_relationships(translator: NLToSQLTranslator):
     """Demonstrate semantic relationship extraction."""
     print_section("Semantic Relationship Extraction")
-    
-    translator = NLToSQLTranslator()
+
     query = "Show me high risk assets that need immediate patching"
     
     print(f"Query: {query}\n")
@@ -116,12 +115,10 @@ def demo_semantic_relationships():
     print(explanation)
 
 
-def demo_complex_queries():
+def demo_complex_queries(translator: NLToSQLTranslator):
     """Demonstrate parsing of complex security queries."""
     print_section("Complex Security Query Parsing")
     
-    translator = NLToSQLTranslator()
-    
     queries = [
         "Find all Siemens PLCs in our network",
         "Show me assets that are both vulnerable and recently active",
@@ -142,11 +139,10 @@ def demo_complex_queries():
             print(f"Recognized Vendors: {[v['value'] for v in vendor_values]}")
 
 
-def demo_dependency_paths():
+def demo_dependency_paths(translator: NLToSQLTranslator):
     """Demonstrate dependency path analysis between entities."""
     print_section("Dependency Path Analysis")
-    
-    translator = NLToSQLTranslator()
+
     query = "Find assets vulnerable to CVE-2025-10501 in site 54"
     
     print(f"Query: {query}\n")
@@ -154,23 +150,25 @@ def demo_dependency_paths():
     result = translator.translate_with_details(query)
     tree = translator.analyze_dependency_tree(query)
     
-    print("Extracted Conditions:")
-    print("-" * 80)
+    # Collect the report and print it in one go rather than line by line
+    lines = ["Extracted Conditions:", "-" * 80]
     for cond in result["query"]["where"]:
-        print(f"  Column: {cond['column']}")
-        print(f"  Operator: {cond['operator']}")
-        print(f"  Value: {cond['value']}")
-        print()
-    
-    print("\nEntity Recognition:")
-    print("-" * 80)
-    print(f"Columns found: {len(result['entities']['columns'])}")
+        lines.append(f"  Column: {cond['column']}")
+        lines.append(f"  Operator: {cond['operator']}")
+        lines.append(f"  Value: {cond['value']}")
+        lines.append("")
+    
+    lines.append("\nEntity Recognition:")
+    lines.append("-" * 80)
+    lines.append(f"Columns found: {len(result['entities']['columns'])}")
     for col in result['entities']['columns']:
-        print(f"  - {col['column']} (text: '{col['text']}')")
+        lines.append(f"  - {col['column']} (text: '{col['text']}')")
     
-    print(f"\nValues found: {len(result['entities']['values'])}")
+    lines.append(f"\nValues found: {len(result['entities']['values'])}")
     for val in result['entities']['values']:
-        print(f"  - {val['value']} (type: {val['type']}, text: '{val['text']}')")
+        lines.append(f"  - {val['value']} (type: {val['type']}, text: '{val['text']}')")
+
+    print("\n".join(lines))
 
 
 def main():
@@ -180,13 +178,16 @@ def main():
     print("="*80)
     
     try:
+        # Load the spaCy model once and share it across all demos
+        translator = NLToSQLTranslator()
+
         # Run all demos
-        demo_basic_dependency_analysis()
-        demo_cve_recognition()
-        demo_ip_recognition()
-        demo_semantic_relationships()
-        demo_complex_queries()
-        demo_dependency_paths()
+        demo_basic_dependency_analysis(translator)
+        demo_cve_recognition(translator)
+        demo_ip_recognition(translator)
+        demo_semantic_relationships(translator)
+        demo_complex_queries(translator)
+        demo_dependency_paths(translator)
         
         print("\n" + "="*80)
         print("All demonstrations completed successfully!")
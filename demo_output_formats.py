@@ -20,12 +20,14 @@ def demo_output_formats():
     print("=" * 80)
     print(f"\nQuery: \"{query}\"\n")
     
-    # Demo 1: SQL format (default)
+    # One translator serves every demo; the output format is chosen per call
+    translator = NLToSQLTranslator(output_format="json")
+    
+    # Demo 1: SQL format (requested per call; this translator defaults to JSON)
     print("-" * 80)
     print("1. SQL Format (output_format='sql')")
     print("-" * 80)
-    translator_sql = NLToSQLTranslator(output_format="sql")
-    result = translator_sql.translate_with_format(query)
+    result = translator.translate_with_format(query, output_format="sql")
     print(f"Type: {type(result)}")
     print(f"Result:\n{result}\n")
     
@@ -33,8 +35,7 @@ def demo_output_formats():
     print("-" * 80)
     print("2. JSON Format (output_format='json')")
     print("-" * 80)
-    translator_json = NLToSQLTranslator(output_format="json")
-    result = translator_json.translate_with_format(query)
+    result = translator.translate_with_format(query, output_format="json")
     print(f"Type: {type(result)}")
     print(f"Result:")
     import json
@@ -45,8 +46,7 @@ def demo_output_formats():
     print("-" * 80)
     print("3. Both Formats (output_format='both')")
     print("-" * 80)
-    translator_both = NLToSQLTranslator(output_format="both")
-    result = translator_both.translate_with_format(query)
+    result = translator.translate_with_format(query, output_format="both")
     print(f"Type: {type(result)}")
     print(f"Result has keys: {list(result.keys())}")
     print(f"\nSQL:\n{result['sql']}")
@@ -58,8 +58,7 @@ def demo_output_formats():
     print("-" * 80)
     print("4. Override Format at Call Time")
     print("-" * 80)
-    translator = NLToSQLTranslator(output_format="json")  # Default is JSON
-    print("Translator default format: json")
+    print(f"Translator default format: {translator.output_format}")
     print("\nOverride to SQL:")
     result = translator.translate_with_format(query, output_format="sql")
     print(result)
@@ -69,7 +68,6 @@ def demo_output_formats():
     print("-" * 80)
     print("5. Using format_output() Helper")
     print("-" * 80)
-    translator = NLToSQLTranslator()
     query_json = translator.translate(query)
     
     print("Format as SQL:")
@@ -93,10 +91,8 @@ def demo_output_formats():
         "Show me high risk assets"
     ]
     
-    translator = NLToSQLTranslator(output_format="sql")
-    
     for q in queries:
-        sql = translator.translate_with_format(q)
+        sql = translator.translate_with_format(q, output_format="sql")
         print(f"Query: {q}")
         print(f"SQL:   {sql}")
         print()
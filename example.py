@@ -9,10 +9,11 @@ from nl_to_sql import NLToSQLTranslator
 import json
 
 
-def print_result(query, result):
+def print_result(query, result, category):
     """Pretty print a translation result."""
     print(f"\n{'='*80}")
     print(f"Query: {query}")
+    print(f"Category: {category}")
     print(f"{'='*80}")
     print("\nJSON Representation:")
     print(json.dumps(result["query"], indent=2))
@@ -98,19 +99,25 @@ def main():
             "high risk"
         ]
         
-        # Combine all queries
-        queries = (
-            security_prompts +
-            discovery_prompts +
-            targeted_prompts +
-            incident_prompts +
-            troubleshooting_prompts +
-            realistic_prompts
-        )
+        # Combine all queries, tagged with their category
+        categories = [
+            ("Security & Vulnerability Management", security_prompts),
+            ("Asset Discovery & Investigation", discovery_prompts),
+            ("Targeted Searches", targeted_prompts),
+            ("Incident Response", incident_prompts),
+            ("Troubleshooting", troubleshooting_prompts),
+            ("Realistic", realistic_prompts),
+        ]
+        tagged_queries = [
+            (query, category)
+            for category, prompts in categories
+            for query in prompts
+        ]
         
-        for query in queries:
-            result = translator.translate_with_details(query)
-            print_result(query, result)
+        # Translate all queries in one batched pass through spaCy
+        results = translator.translate_many_tagged(tagged_queries)
+        for (query, _), (result, category) in zip(tagged_queries, results):
+            print_result(query, result, category)
         
         print("\n✓ All examples completed successfully!")
         
@@ -11,7 +11,44 @@ Usage:
 import sys
 import json
 import argparse
-from nl_to_sql import NLToSQLTranslator
+
+try:
+    import orjson
+except ImportError:  # optional: pip install nl-to-sql[fast]
+    orjson = None
+
+
+def write_json(data, pretty=False):
+    """
+    Serialize data as JSON directly to stdout, followed by a newline.
+
+    Uses orjson when it is installed, writing its bytes straight to the
+    underlying stdout buffer, and falls back to the standard library. Both
+    produce the same output: no spaces after separators in compact output,
+    and non-ASCII characters written as UTF-8 rather than escaped.
+    """
+    stream = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and stream is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # Not supported by orjson; use the standard library instead
+        else:
+            sys.stdout.flush()
+            stream.write(encoded)
+            return
+
+    json.dump(
+        data,
+        sys.stdout,
+        indent=2 if pretty else None,
+        separators=(",", ": ") if pretty else (",", ":"),
+        ensure_ascii=False,
+    )
+    sys.stdout.write("\n")
 
 
 def main():
@@ -112,6 +149,9 @@ Examples:
     if args.sql:
         output_format = "sql"
     
+    # Imported here so that --help and argument errors don't pay for loading spaCy
+    from nl_to_sql import NLToSQLTranslator
+
     # Initialize translator
     try:
         translator = NLToSQLTranslator(
@@ -130,10 +170,7 @@ Examples:
         if args.details:
             # Details mode - output full translation details
             result = translator.translate_with_details(query)
-            if args.pretty:
-                print(json.dumps(result, indent=2))
-            else:
-                print(json.dumps(result))
+            write_json(result, args.pretty)
         else:
             # Use the new translate_with_format method
             result = translator.translate_with_format(query, output_format)
@@ -143,20 +180,18 @@ Examples:
                 print(result)
             elif output_format == "json":
                 # JSON output
-                if args.pretty:
-                    print(json.dumps(result, indent=2))
-                else:
-                    print(json.dumps(result))
+                write_json(result, args.pretty)
             elif output_format == "both":
                 # Both SQL and JSON
                 if args.pretty:
                     print("SQL:")
                     print(result["sql"])
                     print("\nJSON:")
-                    print(json.dumps(result["json"], indent=2))
+                    write_json(result["json"], pretty=True)
                 else:
                     print(f"SQL: {result['sql']}")
-                    print(f"JSON: {json.dumps(result['json'])}")
+                    sys.stdout.write("JSON: ")
+                    write_json(result["json"])
         
         return 0
         
@@ -4,6 +4,9 @@ Constants for NL-to-SQL translation.
 This module contains configuration constants used throughout the translator.
 """
 
+import os
+import warnings
+
 # Proximity-based matching
 MAX_PROXIMITY_DISTANCE = 5
 """Maximum token distance for proximity-based column-value matching."""
@@ -16,3 +19,79 @@ MAX_DEPENDENCY_DEPTH = 100
 MAX_LIMIT_SEARCH_DISTANCE = 3
 """Maximum token distance when searching for LIMIT values."""
 
+
+# spaCy pipeline
+DEFAULT_DISABLED_COMPONENTS = ("ner", "textcat")
+"""spaCy pipeline components not needed for translation (disabled at load)."""
+
+ENTITY_RECOGNITION_COMPONENTS = (
+    "transformer",
+    "tok2vec",
+    "tagger",
+    "morphologizer",
+    "attribute_ruler",
+)
+"""
+spaCy pipeline components entity recognition depends on.
+
+Entity recognition only reads token text, part-of-speech tags and lexical
+attributes, so the parser, lemmatizer and NER can be skipped when documents
+are processed for it alone.
+"""
+
+# Translation cache
+TRANSLATION_CACHE_SIZE = 1024
+"""Maximum number of query translations each translator keeps cached."""
+
+# Value extraction
+VALUE_CHECK_CACHE_SIZE = 4096
+"""Maximum number of token texts each cached value pattern check remembers."""
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        The parsed value, or the default with a warning if the variable
+        is not an integer of at least 1
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = None
+    if value is None or value < 1:
+        warnings.warn(
+            f"Ignoring {name}={raw!r}: expected a positive integer, "
+            f"using {default}",
+            stacklevel=2,
+        )
+        return default
+    return value
+
+
+# Batch processing
+NLP_BATCH_SIZE = _env_positive_int("NL2SQL_BATCH_SIZE", 32)
+"""
+Number of queries spaCy processes per batch in nlp.pipe().
+
+Set the NL2SQL_BATCH_SIZE environment variable to tune it, e.g. larger
+batches for transformer models running on a GPU.
+"""
+
+NLP_N_PROCESS = _env_positive_int("NL2SQL_N_PROCESS", 1)
+"""
+Number of processes spaCy uses in nlp.pipe().
+
+Defaults to 1: for a few dozen short queries, the cost of starting worker
+processes and pickling documents far outweighs any parallel speedup. Set the
+NL2SQL_N_PROCESS environment variable to use more when translating large
+query corpora.
+"""
@@ -5,15 +5,13 @@ This module provides utilities for working with spaCy dependency trees,
 extracted from the QueryParser to improve single responsibility.
 """
 
-import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from spacy.tokens import Token
+from spacy.attrs import HEAD
+from spacy.tokens import Doc, Token
 
 from .constants import MAX_DEPENDENCY_DEPTH
 
-logger = logging.getLogger(__name__)
-
 
 class DependencyPathFinder:
     """Finds dependency paths between tokens in a parse tree."""
@@ -27,10 +25,34 @@ class DependencyPathFinder:
         """
         self.max_depth = max_depth
 
+        # Paths found in the current document, keyed by (token1.i, token2.i)
+        self._cache_doc: Optional[Doc] = None
+        self._path_cache: Dict[Tuple[int, int], List[Token]] = {}
+
+        # Head index of every token in the current document, built on demand
+        self._heads: Optional[List[int]] = None
+
+    def reset_for_doc(self, doc: Optional[Doc] = None) -> None:
+        """
+        Discard cached paths and start caching paths for a new document.
+
+        Paths are also reset automatically when tokens from another document
+        are passed to find_path().
+
+        Args:
+            doc: Document whose paths will be cached next
+        """
+        self._cache_doc = doc
+        self._path_cache = {}
+        self._heads = None
+
     def find_path(self, token1: Token, token2: Token) -> List[Token]:
         """
         Get the dependency path between two tokens.
 
+        Paths are memoized per document, and a cached path is reused in
+        reverse when the same pair is queried in the opposite direction.
+
         Args:
             token1: First token
             token2: Second token
@@ -38,71 +60,92 @@ class DependencyPathFinder:
         Returns:
             List of tokens in the path
         """
-        lca = self._find_lowest_common_ancestor(token1, token2)
-        if not lca:
-            return []
+        if token1.doc is not self._cache_doc:
+            self.reset_for_doc(token1.doc)
 
-        path_to_lca = self._build_path_to_ancestor(token1, lca)
-        path_from_lca = self._build_path_to_ancestor(token2, lca)
+        path = self._path_cache.get((token1.i, token2.i))
+        if path is None:
+            reverse_path = self._path_cache.get((token2.i, token1.i))
+            if reverse_path is not None:
+                path = reverse_path[::-1]
+            else:
+                path = self._compute_path(token1, token2)
+            self._path_cache[(token1.i, token2.i)] = path
 
-        return path_to_lca + [lca] + list(reversed(path_from_lca))
+        return list(path)
 
-    def _find_lowest_common_ancestor(
-        self, token1: Token, token2: Token
-    ) -> Optional[Token]:
+    def _compute_path(self, token1: Token, token2: Token) -> List[Token]:
         """
-        Find the lowest common ancestor of two tokens.
+        Compute the dependency path between two tokens.
+
+        The walk runs over the document's head indices rather than Token
+        objects. The ancestor chain of token2 is recorded first; token1's
+        ancestors are then visited bottom-up, and the first one found on
+        token2's chain is their lowest common ancestor. Everything above it
+        on that chain is a common ancestor too, and the path turns at the
+        one with the smallest index. That ancestor may sit above the
+        meeting point; the path then runs through words such as "with" or
+        "has" that operator inference relies on. Indices are mapped back to
+        tokens only once the path is complete.
 
         Args:
             token1: First token
             token2: Second token
 
         Returns:
-            Lowest common ancestor token or None
+            List of tokens in the path
         """
-        ancestors1 = set([token1] + list(token1.ancestors))
-        ancestors2 = set([token2] + list(token2.ancestors))
-
-        common = ancestors1 & ancestors2
-        if not common:
-            return None
-
-        try:
-            return min(common, key=lambda t: t.i)
-        except ValueError:
-            # No common ancestors found (empty set)
-            return None
-        except AttributeError as e:
-            # Token missing 'i' attribute - should never happen with spaCy tokens
-            logger.warning(f"Unexpected token structure in dependency path: {e}")
-            return None
-
-    def _build_path_to_ancestor(self, token: Token, ancestor: Token) -> List[Token]:
+        # find_path() has already made token1's document the cached one
+        doc = token1.doc
+        heads = self._heads
+        if heads is None:
+            heads = self._heads = self._get_head_indices(doc)
+
+        # token2 and its ancestors, with each index's position in the chain
+        chain2 = [token2.i]
+        positions2 = {token2.i: 0}
+        i = token2.i
+        while heads[i] != i and len(chain2) <= self.max_depth:
+            i = heads[i]
+            positions2[i] = len(chain2)
+            chain2.append(i)
+
+        # token1 and its ancestors, stopping at the first one on token2's chain
+        up = [token1.i]
+        i = token1.i
+        while i not in positions2:
+            if heads[i] == i or len(up) > self.max_depth:
+                # Both tokens belong to different trees (e.g. separate sentences)
+                return []
+            i = heads[i]
+            up.append(i)
+
+        # Climb on along token2's chain, from the meeting point up to (but
+        # excluding) the common ancestor with the smallest index
+        meet = positions2[i]
+        turn = positions2[min(chain2[meet:])]
+        up[-1:] = chain2[meet:turn]
+
+        path = up[:self.max_depth]
+        path.append(chain2[turn])
+        path.extend(reversed(chain2[:turn][:self.max_depth]))
+
+        return [doc[i] for i in path]
+
+    @staticmethod
+    def _get_head_indices(doc: Doc) -> List[int]:
         """
-        Build path from token to ancestor with safety limit.
+        Get the absolute head index of every token in a document.
+
+        Heads are exported with a single Doc.to_array() call instead of
+        reading token.head for each token; spaCy stores them as offsets
+        relative to each token.
 
         Args:
-            token: Starting token
-            ancestor: Target ancestor token
+            doc: spaCy processed document
 
         Returns:
-            List of tokens in the path (excluding ancestor)
+            List where item i is the index of token i's head
         """
-        path = []
-        current = token
-        depth = 0
-
-        while (
-            current != ancestor and current is not None and depth < self.max_depth
-        ):
-            path.append(current)
-
-            # Check for ROOT token (where head == self)
-            if current.head == current:
-                break
-
-            current = current.head
-            depth += 1
-
-        return path
-
+        offsets = doc.to_array(HEAD).astype("int64").tolist()
+        return [i + offset for i, offset in enumerate(offsets)]
@@ -2,23 +2,74 @@
 Entity recognition for natural language queries using spaCy patterns.
 """
 
-from typing import Any, Dict, List
+import sys
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from spacy.matcher import Matcher
+from spacy.symbols import NOUN, PROPN
 from spacy.tokens import Doc
 
-from .schema import (
-    COLUMN_SYNONYMS,
-    MULTI_VALUE_COLUMNS,
-    TEXT_LIST_COLUMNS,
-    VALID_COLUMNS,
+from .constants import (
+    ENTITY_RECOGNITION_COMPONENTS,
+    NLP_BATCH_SIZE,
+    NLP_N_PROCESS,
 )
+from .schema import COLUMN_SYNONYMS, LIST_VALUE_COLUMNS, VALID_COLUMNS
 from .value_extractors import ValueExtractor
 
+# Parts of speech of tokens taken as values after multi-value columns
+NOUN_POS_TAGS = frozenset((NOUN, PROPN))
+
+# Entity categories returned by EntityRecognizer.recognize(), in order
+ENTITY_CATEGORIES = (
+    "columns",
+    "operators",
+    "values",
+    "logic",
+    "intent",
+    "quantifiers",
+    "vendors",
+    "devices",
+    "risk_levels",
+    "time_modifiers",
+    "vuln_keywords",
+    "exclusions",
+)
+
 
 class EntityRecognizer:
     """Recognizes entities in natural language queries for SQL translation."""
 
+    # Entity category and name of the field holding the label's sub-value
+    # (e.g. "COLUMN_SITE" -> {"column": "site"}), by match label prefix
+    LABEL_CATEGORIES = {
+        "COLUMN_": ("columns", "column"),
+        "OP_": ("operators", "operator"),
+        "LOGIC_": ("logic", "type"),
+        "INTENT_": ("intent", "type"),
+        "QUANTIFIER_": ("quantifiers", "type"),
+        "VENDOR_": ("vendors", "vendor"),
+        "DEVICE_": ("devices", "device"),
+        "RISK_": ("risk_levels", "level"),
+        "TIME_": ("time_modifiers", "type"),
+        "VULN_": ("vuln_keywords", "type"),
+    }
+
+    # Compiled patterns shared by all recognizers using the same vocabulary,
+    # keyed by id(vocab):
+    # (vocab, matcher, token_patterns, phrase_patterns, label_entities)
+    _pattern_cache: Dict[
+        int,
+        Tuple[
+            Any,
+            Matcher,
+            Dict[int, List[int]],
+            Dict[int, List[Tuple[Tuple[int, ...], int]]],
+            Dict[int, Tuple[str, Dict[str, Any]]],
+        ],
+    ] = {}
+
     def __init__(self, nlp: Any) -> None:
         """
         Initialize the entity recognizer.
@@ -27,9 +78,224 @@ class EntityRecognizer:
             nlp: spaCy language model
         """
         self.nlp = nlp
-        self.matcher = Matcher(nlp.vocab)
         self.value_extractor = ValueExtractor()
+
+        # "not" is both a BOOL_FALSE word and part of OP_NOT_EQUALS phrases
+        self._not_equals_id = nlp.vocab.strings.add("OP_NOT_EQUALS")
+        self._bool_false_id = nlp.vocab.strings.add("BOOL_FALSE")
+
+        # Match IDs of single-token literal patterns, keyed by the string
+        # store hash of their lowercase text (as in Token.lower)
+        self.token_patterns: Dict[int, List[int]]
+
+        # Multi-token literal patterns, keyed by the lowercase hash of their
+        # first word: (hashes of the remaining words, match ID)
+        self.phrase_patterns: Dict[int, List[Tuple[Tuple[int, ...], int]]]
+
+        # Entity category and fixed fields produced by each match ID
+        self.label_entities: Dict[int, Tuple[str, Dict[str, Any]]]
+
+        cached = self._pattern_cache.get(id(nlp.vocab))
+        if cached is not None and cached[0] is nlp.vocab:
+            (
+                _,
+                self.matcher,
+                self.token_patterns,
+                self.phrase_patterns,
+                self.label_entities,
+            ) = cached
+            return
+
+        # Patterns that are not lowercase literals
+        self.matcher = Matcher(nlp.vocab)
+        self.token_patterns = {}
+        self.phrase_patterns = {}
+        self.label_entities = {}
+
         self._setup_patterns()
+        self._pattern_cache[id(nlp.vocab)] = (
+            nlp.vocab,
+            self.matcher,
+            self.token_patterns,
+            self.phrase_patterns,
+            self.label_entities,
+        )
+
+    def _add_patterns(self, label: str, patterns: List[List[Dict[str, Any]]]) -> None:
+        """
+        Register Matcher-style patterns for a label.
+
+        Patterns made only of lowercase literals are stored in lookup tables
+        probed once per token instead of being run through the spaCy Matcher:
+        single-token ones in token_patterns, longer ones in phrase_patterns.
+        Any other pattern goes to the Matcher.
+
+        Args:
+            label: Match label (e.g. "COLUMN_SITE")
+            patterns: List of token patterns, as accepted by Matcher.add()
+        """
+        strings = self.nlp.vocab.strings
+        match_id = strings.add(label)
+        self.label_entities[match_id] = self._get_label_entity(label)
+        matcher_patterns = []
+
+        for pattern in patterns:
+            sequences = self._get_literal_sequences(pattern)
+            if sequences is None:
+                matcher_patterns.append(pattern)
+                continue
+
+            for sequence in sequences:
+                first, *rest = [strings.add(word) for word in sequence]
+                if rest:
+                    phrases = self.phrase_patterns.setdefault(first, [])
+                    phrase = (tuple(rest), match_id)
+                    if phrase not in phrases:
+                        phrases.append(phrase)
+                else:
+                    match_ids = self.token_patterns.setdefault(first, [])
+                    if match_id not in match_ids:
+                        match_ids.append(match_id)
+
+        if matcher_patterns:
+            self.matcher.add(label, matcher_patterns)
+
+    @classmethod
+    def _get_label_entity(cls, label: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Work out which entities a match label produces.
+
+        Args:
+            label: Match label (e.g. "COLUMN_SITE", "BOOL_TRUE", "EXCLUSION")
+
+        Returns:
+            Tuple of (entity category, fields every entity for this label
+            carries besides its text and position). Field values are
+            interned so they share the schema's column name strings.
+        """
+        if label.startswith("BOOL_"):
+            return "values", {"value": label == "BOOL_TRUE", "type": "boolean"}
+
+        if label == "EXCLUSION":
+            return "exclusions", {}
+
+        for prefix, (category, field_name) in cls.LABEL_CATEGORIES.items():
+            if label.startswith(prefix):
+                value = sys.intern(label.replace(prefix, "").lower())
+                return category, {field_name: value}
+
+        raise ValueError(f"Unknown entity label: {label}")
+
+    @staticmethod
+    def _get_literal_sequences(
+        pattern: List[Dict[str, Any]]
+    ) -> Optional[List[Tuple[str, ...]]]:
+        """
+        Get the word sequences matched by a lowercase literal pattern.
+
+        Args:
+            pattern: Token pattern, as accepted by Matcher.add()
+
+        Returns:
+            Word sequences matched by the pattern, or None if any of its tokens
+            is not of the form {"LOWER": word} or {"LOWER": {"IN": words}}
+
+        Example:
+            >>> EntityRecognizer._get_literal_sequences(
+            ...     [{"LOWER": "high"}, {"LOWER": {"IN": ["risk", "priority"]}}]
+            ... )
+            [('high', 'risk'), ('high', 'priority')]
+        """
+        choices = []
+        for token_pattern in pattern:
+            if list(token_pattern) != ["LOWER"]:
+                return None
+
+            value = token_pattern["LOWER"]
+            if isinstance(value, str):
+                choices.append([value])
+            elif isinstance(value, dict) and list(value) == ["IN"]:
+                choices.append(list(value["IN"]))
+            else:
+                return None
+
+        return list(product(*choices)) if choices else None
+
+    def _find_matches(self, doc: Doc) -> List[Tuple[int, int, int]]:
+        """
+        Find all pattern matches in a document.
+
+        Matches are returned in the same order the spaCy Matcher would report
+        them if it held every pattern: by end token, with longer matches
+        first and ties in pattern registration order. A negation word inside
+        a "not equals" operator (e.g. "is not") is reported only as part of
+        the operator, not also as a boolean false value.
+
+        Args:
+            doc: spaCy processed document
+
+        Returns:
+            List of (match_id, start, end) tuples
+        """
+        lowers = [token.lower for token in doc]
+        phrase_matches = self._find_phrase_matches(lowers)
+        if len(self.matcher):
+            phrase_matches.extend(self.matcher(doc))
+            phrase_matches.sort(key=lambda match: (match[2], match[1]))
+
+        phrase_count = len(phrase_matches)
+        token_patterns = self.token_patterns
+        bool_false_id = self._bool_false_id
+
+        # Token positions covered by "not equals" operators
+        negated = {
+            i
+            for match_id, start, end in phrase_matches
+            if match_id == self._not_equals_id
+            for i in range(start, end)
+        }
+
+        matches = []
+        k = 0
+        for start, lower in enumerate(lowers):
+            end = start + 1
+
+            # Multi-token matches ending here started before this token
+            while k < phrase_count and phrase_matches[k][2] == end:
+                matches.append(phrase_matches[k])
+                k += 1
+
+            for match_id in token_patterns.get(lower, ()):
+                if match_id == bool_false_id and start in negated:
+                    continue
+                matches.append((match_id, start, end))
+
+        matches.extend(phrase_matches[k:])
+        return matches
+
+    def _find_phrase_matches(self, lowers: List[int]) -> List[Tuple[int, int, int]]:
+        """
+        Find multi-token literal pattern matches.
+
+        Args:
+            lowers: Lowercase hash of each token in the document
+
+        Returns:
+            List of (match_id, start, end) tuples, ordered by end token with
+            longer matches first and ties in pattern registration order
+        """
+        phrase_patterns = self.phrase_patterns
+
+        matches = []
+        for start, lower in enumerate(lowers):
+            for rest, match_id in phrase_patterns.get(lower, ()):
+                end = start + 1 + len(rest)
+                if tuple(lowers[start + 1:end]) == rest:
+                    matches.append((match_id, start, end))
+
+        # Stable sort: matches sharing a span keep registration order
+        matches.sort(key=lambda match: (match[2], match[1]))
+        return matches
 
     def _setup_patterns(self) -> None:
         """Setup matching patterns for entities."""
@@ -37,127 +303,127 @@ class EntityRecognizer:
         # Column name patterns
         for column, synonyms in COLUMN_SYNONYMS.items():
             patterns = [[{"LOWER": syn}] for syn in synonyms]
-            self.matcher.add(f"COLUMN_{column.upper()}", patterns)
+            self._add_patterns(f"COLUMN_{column.upper()}", patterns)
 
         # Comparison operator patterns
-        self.matcher.add("OP_EQUALS", [
+        self._add_patterns("OP_EQUALS", [
             [{"LOWER": {"IN": ["is", "equals", "equal"]}}],
             [{"LOWER": "="}, {"LOWER": "="}],
         ])
 
-        self.matcher.add("OP_NOT_EQUALS", [
+        self._add_patterns("OP_NOT_EQUALS", [
             [{"LOWER": "not"}, {"LOWER": {"IN": ["is", "equals", "equal"]}}],
             [{"LOWER": "is"}, {"LOWER": "not"}],
             [{"LOWER": "!="}, {"LOWER": "="}],
         ])
 
-        self.matcher.add("OP_GREATER", [
+        self._add_patterns("OP_GREATER", [
             [{"LOWER": {"IN": ["greater", "more", "above"]}}],
             [{"LOWER": ">"}, {"LOWER": ">"}],
         ])
 
-        self.matcher.add("OP_LESS", [
+        self._add_patterns("OP_LESS", [
             [{"LOWER": {"IN": ["less", "fewer", "below"]}}],
             [{"LOWER": "<"}, {"LOWER": "<"}],
         ])
 
-        self.matcher.add("OP_LIKE", [
+        self._add_patterns("OP_LIKE", [
             [{"LOWER": {"IN": ["contains", "like", "includes", "has"]}}],
             [{"LOWER": "similar"}, {"LOWER": "to"}],
         ])
 
-        self.matcher.add("OP_IN", [
+        self._add_patterns("OP_IN", [
             [{"LOWER": "in"}],
         ])
 
         # Boolean value patterns
-        self.matcher.add("BOOL_TRUE", [
+        self._add_patterns("BOOL_TRUE", [
             [{"LOWER": {"IN": ["true", "yes", "approved", "valid", "enabled"]}}],
         ])
 
-        self.matcher.add("BOOL_FALSE", [
+        self._add_patterns("BOOL_FALSE", [
             [{"LOWER": {"IN": ["false", "no", "not", "disabled", "invalid"]}}],
         ])
 
         # Logical connectors
-        self.matcher.add("LOGIC_AND", [
+        self._add_patterns("LOGIC_AND", [
             [{"LOWER": {"IN": ["and", "with"]}}],
         ])
 
-        self.matcher.add("LOGIC_OR", [
+        self._add_patterns("LOGIC_OR", [
             [{"LOWER": {"IN": ["or"]}}],
         ])
 
         # Query intent patterns
-        self.matcher.add("INTENT_SHOW", [
+        self._add_patterns("INTENT_SHOW", [
             [{"LOWER": {"IN": ["show", "display", "list", "get", "find", "fetch"]}}],
         ])
 
-        self.matcher.add("INTENT_COUNT", [
+        self._add_patterns("INTENT_COUNT", [
             [{"LOWER": "how"}, {"LOWER": "many"}],
             [{"LOWER": "count"}],
             [{"LOWER": "number"}, {"LOWER": "of"}],
         ])
 
-        self.matcher.add("INTENT_EXISTS", [
+        self._add_patterns("INTENT_EXISTS", [
             [{"LOWER": {"IN": ["has", "does", "is", "are", "exists"]}}],
         ])
 
         # All/any patterns
-        self.matcher.add("QUANTIFIER_ALL", [
+        self._add_patterns("QUANTIFIER_ALL", [
             [{"LOWER": "all"}],
             [{"LOWER": "every"}],
         ])
 
-        self.matcher.add("QUANTIFIER_ANY", [
+        self._add_patterns("QUANTIFIER_ANY", [
             [{"LOWER": "any"}],
             [{"LOWER": "some"}],
         ])
         
         # Vendor names
-        self.matcher.add("VENDOR_SIEMENS", [
+        self._add_patterns("VENDOR_SIEMENS", [
             [{"LOWER": "siemens"}],
         ])
         
-        self.matcher.add("VENDOR_ROCKWELL", [
+        self._add_patterns("VENDOR_ROCKWELL", [
             [{"LOWER": "rockwell"}],
             [{"LOWER": "allen"}, {"LOWER": "-"}, {"LOWER": "bradley"}],
             [{"LOWER": "allen"}, {"LOWER": "bradley"}],
         ])
         
         # Device types
-        self.matcher.add("DEVICE_PLC", [
+        self._add_patterns("DEVICE_PLC", [
             [{"LOWER": "plc"}],
             [{"LOWER": "plcs"}],
         ])
         
         # Risk levels
-        self.matcher.add("RISK_HIGH", [
+        self._add_patterns("RISK_HIGH", [
             [{"LOWER": "high"}, {"LOWER": {"IN": ["risk", "priority"]}}],
             [{"LOWER": "high"}, {"LOWER": "-"}, {"LOWER": {"IN": ["risk", "priority"]}}],
             [{"LOWER": "critical"}],
         ])
         
         # Time-based patterns
-        self.matcher.add("TIME_RECENT", [
+        self._add_patterns("TIME_RECENT", [
             [{"LOWER": {"IN": ["recent", "recently", "latest", "new", "newly"]}}],
         ])
         
-        self.matcher.add("TIME_ACTIVE", [
+        self._add_patterns("TIME_ACTIVE", [
             [{"LOWER": {"IN": ["active", "online", "connected"]}}],
         ])
         
         # Vulnerability patterns
-        self.matcher.add("VULN_VULNERABLE", [
+        self._add_patterns("VULN_VULNERABLE", [
             [{"LOWER": {"IN": ["vulnerable", "vulnerability", "vulnerabilities"]}}],
         ])
         
-        self.matcher.add("VULN_AFFECTED", [
+        self._add_patterns("VULN_AFFECTED", [
             [{"LOWER": {"IN": ["affected", "impacted"]}}],
         ])
         
         # Exclusion patterns
-        self.matcher.add("EXCLUSION", [
+        self._add_patterns("EXCLUSION", [
             [{"LOWER": {"IN": ["excluding", "except", "without"]}}],
         ])
 
@@ -175,145 +441,116 @@ class EntityRecognizer:
         # CVE identifiers are often tokenized as multiple tokens (CVE-YYYY-NNNNN)
         cve_spans = self.value_extractor.find_cve_spans(doc)
 
-        matches = self.matcher(doc)
+        matches = self._find_matches(doc)
 
         entities: Dict[str, List[Dict[str, Any]]] = {
-            "columns": [],
-            "operators": [],
-            "values": [],
-            "logic": [],
-            "intent": [],
-            "quantifiers": [],
-            "vendors": [],
-            "devices": [],
-            "risk_levels": [],
-            "time_modifiers": [],
-            "vuln_keywords": [],
-            "exclusions": [],
+            category: [] for category in ENTITY_CATEGORIES
         }
 
+        # End positions of multi-value column references, for the adjacent
+        # value pass below
+        multivalue_col_ends: List[int] = []
+
+        label_entities = self.label_entities
         for match_id, start, end in matches:
-            span = doc[start:end]
-            match_label = self.nlp.vocab.strings[match_id]
-
-            if match_label.startswith("COLUMN_"):
-                column_name = match_label.replace("COLUMN_", "").lower()
-                entities["columns"].append({
-                    "text": span.text,
-                    "column": column_name,
-                    "start": start,
-                    "end": end,
-                })
-
-            elif match_label.startswith("OP_"):
-                operator = match_label.replace("OP_", "").lower()
-                entities["operators"].append({
-                    "text": span.text,
-                    "operator": operator,
-                    "start": start,
-                    "end": end,
-                })
-
-            elif match_label.startswith("BOOL_"):
-                bool_value = match_label == "BOOL_TRUE"
-                entities["values"].append({
-                    "text": span.text,
-                    "value": bool_value,
-                    "type": "boolean",
-                    "start": start,
-                    "end": end,
-                })
-
-            elif match_label.startswith("LOGIC_"):
-                logic_type = match_label.replace("LOGIC_", "").lower()
-                entities["logic"].append({
-                    "text": span.text,
-                    "type": logic_type,
-                    "start": start,
-                    "end": end,
-                })
-
-            elif match_label.startswith("INTENT_"):
-                intent_type = match_label.replace("INTENT_", "").lower()
-                entities["intent"].append({
-                    "text": span.text,
-                    "type": intent_type,
-                    "start": start,
-                    "end": end,
-                })
-
-            elif match_label.startswith("QUANTIFIER_"):
-                quantifier_type = match_label.replace("QUANTIFIER_", "").lower()
-                entities["quantifiers"].append({
-                    "text": span.text,
-                    "type": quantifier_type,
-                    "start": start,
-                    "end": end,
-                })
-            
-            elif match_label.startswith("VENDOR_"):
-                vendor_name = match_label.replace("VENDOR_", "").lower()
-                entities["vendors"].append({
-                    "text": span.text,
-                    "vendor": vendor_name,
-                    "start": start,
-                    "end": end,
-                })
-            
-            elif match_label.startswith("DEVICE_"):
-                device_type = match_label.replace("DEVICE_", "").lower()
-                entities["devices"].append({
-                    "text": span.text,
-                    "device": device_type,
-                    "start": start,
-                    "end": end,
-                })
-            
-            elif match_label.startswith("RISK_"):
-                risk_level = match_label.replace("RISK_", "").lower()
-                entities["risk_levels"].append({
-                    "text": span.text,
-                    "level": risk_level,
-                    "start": start,
-                    "end": end,
-                })
-            
-            elif match_label.startswith("TIME_"):
-                time_type = match_label.replace("TIME_", "").lower()
-                entities["time_modifiers"].append({
-                    "text": span.text,
-                    "type": time_type,
-                    "start": start,
-                    "end": end,
-                })
-            
-            elif match_label.startswith("VULN_"):
-                vuln_type = match_label.replace("VULN_", "").lower()
-                entities["vuln_keywords"].append({
-                    "text": span.text,
-                    "type": vuln_type,
-                    "start": start,
-                    "end": end,
-                })
-            
-            elif match_label == "EXCLUSION":
-                entities["exclusions"].append({
-                    "text": span.text,
-                    "start": start,
-                    "end": end,
-                })
+            category, fields = label_entities[match_id]
+
+            # Most matches are a single token, whose text is much cheaper to
+            # read from the Token than through a Span
+            text = doc[start].text if end - start == 1 else doc[start:end].text
+
+            entities[category].append({
+                "text": text,
+                **fields,
+                "start": start,
+                "end": end,
+            })
+
+            if category == "columns" and fields["column"] in LIST_VALUE_COLUMNS:
+                multivalue_col_ends.append(end)
 
         # Extract numeric and string values using value extractor
+        matched_column_count = len(entities["columns"])
         self.value_extractor.extract_all(doc, entities, cve_spans)
 
+        # The value extractor may add columns of its own (e.g. CVE)
+        for col_entity in entities["columns"][matched_column_count:]:
+            if col_entity["column"] in LIST_VALUE_COLUMNS:
+                multivalue_col_ends.append(col_entity["end"])
+
         # Extract values adjacent to multi-value columns
-        self._extract_adjacent_values_for_multivalue_columns(doc, entities)
+        self._extract_adjacent_values_for_multivalue_columns(
+            doc, entities, multivalue_col_ends
+        )
 
         return entities
 
+    def recognize_text(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Recognize entities in a text.
+
+        Pipeline components entity recognition does not use (such as the
+        parser) are skipped; use recognize() on an already processed document
+        when its dependency parse is needed elsewhere.
+
+        Args:
+            text: Natural language text
+
+        Returns:
+            Dictionary of recognized entities by category
+        """
+        return self.recognize(self.nlp(text, disable=self._unused_components()))
+
+    def recognize_many(
+        self,
+        texts: Iterable[str],
+        batch_size: int = NLP_BATCH_SIZE,
+        n_process: int = NLP_N_PROCESS,
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Recognize entities in multiple texts.
+
+        The texts are processed in batches with nlp.pipe(), which is
+        considerably faster than calling the pipeline once per text. Pipeline
+        components entity recognition does not use (such as the parser) are
+        skipped.
+
+        Args:
+            texts: Natural language texts
+            batch_size: Number of texts processed per spaCy batch
+            n_process: Number of processes spaCy uses
+
+        Returns:
+            List of recognized entity dictionaries, in input order
+        """
+        docs = self.nlp.pipe(
+            texts,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=self._unused_components(),
+        )
+        return [self.recognize(doc) for doc in docs]
+
+    def _unused_components(self) -> List[str]:
+        """
+        Get the enabled pipeline components entity recognition does not use.
+
+        Returns:
+            Names of components that can be skipped when processing texts
+            for entity recognition only
+        """
+        return [
+            name
+            for name in self.nlp.pipe_names
+            if name not in ENTITY_RECOGNITION_COMPONENTS
+        ]
+
 
     def _extract_adjacent_values_for_multivalue_columns(
-        self, doc: Doc, entities: Dict[str, List[Dict[str, Any]]]
+        self,
+        doc: Doc,
+        entities: Dict[str, List[Dict[str, Any]]],
+        multivalue_col_ends: List[int],
     ) -> None:
         """
         Extract values that appear adjacent to multi-value column references.
@@ -324,35 +561,37 @@ class EntityRecognizer:
         Args:
             doc: spaCy processed document
             entities: Dictionary to add extracted values to
+            multivalue_col_ends: End token positions of the multi-value column
+                references, in match order
         """
-        # Get all multi-value column entities
-        multivalue_col_entities = [
-            col for col in entities.get("columns", [])
-            if col["column"] in MULTI_VALUE_COLUMNS or col["column"] in TEXT_LIST_COLUMNS
-        ]
+        if not multivalue_col_ends:
+            return
+
+        values = entities["values"]
 
-        for col_entity in multivalue_col_entities:
-            col_end = col_entity["end"]
+        # Start positions of tokens already extracted as values
+        value_starts = {v["start"] for v in values}
 
+        for col_end in multivalue_col_ends:
             # Look for nouns immediately after the column reference
             # Example: "active query maintenance" -> extract "maintenance"
             if col_end < len(doc):
                 next_token = doc[col_end]
 
-                # Check if the next token is a noun (potential value)
-                if next_token.pos_ in ["NOUN", "PROPN"] and not next_token.is_stop:
-                    # Make sure this token isn't already extracted as a value
-                    already_extracted = any(
-                        v["start"] == next_token.i for v in entities.get("values", [])
-                    )
-
-                    if not already_extracted:
-                        entities["values"].append({
-                            "text": next_token.text,
-                            "value": next_token.text,
-                            "type": "string",
-                            "start": next_token.i,
-                            "end": next_token.i + 1,
-                        })
+                # Check if the next token is a noun (potential value) that
+                # isn't already extracted as a value
+                if (
+                    next_token.pos in NOUN_POS_TAGS
+                    and not next_token.is_stop
+                    and next_token.i not in value_starts
+                ):
+                    values.append({
+                        "text": next_token.text,
+                        "value": next_token.text,
+                        "type": "string",
+                        "start": next_token.i,
+                        "end": next_token.i + 1,
+                    })
+                    value_starts.add(next_token.i)
 
 
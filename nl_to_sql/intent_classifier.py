@@ -6,7 +6,30 @@ from typing import Any, Dict, List, Optional
 
 from spacy.tokens import Doc
 
-from .schema import MULTI_VALUE_COLUMNS, TEXT_LIST_COLUMNS
+from .schema import LIST_VALUE_COLUMNS
+
+# Query text fragments that refer to multi-value fields
+MULTI_VALUE_KEYWORDS = frozenset({
+    # CVE/vulnerability related
+    "cve", "vulnerability", "vulnerabilities", "remediat", "patch", "fix",
+    # IP related
+    "old_ip", "old ip", "previous ip",
+    # Query/task related
+    "active_queries", "active queries", "active_tasks", "active tasks",
+    "running query", "running queries", "running task", "running tasks",
+    # Other multi-value fields
+    "children", "code_sections", "asset_insight", "insight_names",
+    "custom_information", "custom_attributes",
+})
+
+# Dependency-structure cues: root verb lemmas and question words
+COUNT_ROOT_LEMMAS = frozenset({"count", "be"})
+COUNT_WORDS = frozenset({"many", "much", "number"})
+EXISTS_ROOT_LEMMAS = frozenset({"have", "be", "exist", "do"})
+EXISTS_QUESTION_WORDS = frozenset({"has", "have", "is", "are", "does", "do"})
+SELECT_ROOT_LEMMAS = frozenset(
+    {"show", "display", "list", "get", "find", "give", "return"}
+)
 
 
 class IntentClassifier:
@@ -17,6 +40,13 @@ class IntentClassifier:
     INTENT_COUNT = "count"
     INTENT_EXISTS = "exists"
 
+    # Map entity intent types to normalized intent types
+    INTENT_MAPPING = {
+        "show": INTENT_SELECT,
+        "count": INTENT_COUNT,
+        "exists": INTENT_EXISTS,
+    }
+
     def __init__(self) -> None:
         """Initialize the intent classifier."""
         self.intent_keywords = {
@@ -46,22 +76,18 @@ class IntentClassifier:
         Returns:
             Dictionary with intent information
         """
+        text_lower = doc.text.lower()
+
         # Early check for multi-value field queries - these should always be SELECT
         # even if they start with "Has" or "Is", because we want to return ALL matching rows
         # Multi-value fields include: CVE, old_ip, active_queries, active_tasks, etc.
-        if self._is_multi_value_field_query(doc, entities):
+        if self._is_multi_value_field_query(entities, text_lower):
             return self._create_intent_result(self.INTENT_SELECT, doc, entities)
 
         # Check for explicit intent entities
         if entities.get("intent"):
             intent_type = entities["intent"][0]["type"]
-            # Map entity intent types to normalized intent types
-            intent_mapping = {
-                "show": self.INTENT_SELECT,
-                "count": self.INTENT_COUNT,
-                "exists": self.INTENT_EXISTS,
-            }
-            normalized_intent = intent_mapping.get(intent_type, self.INTENT_SELECT)
+            normalized_intent = self.INTENT_MAPPING.get(intent_type, self.INTENT_SELECT)
             return self._create_intent_result(normalized_intent, doc, entities)
 
         # Analyze query structure using dependency parsing
@@ -71,7 +97,7 @@ class IntentClassifier:
             return self._create_intent_result(intent, doc, entities)
 
         # Fallback to keyword matching
-        intent = self._keyword_based_classification(doc)
+        intent = self._keyword_based_classification(text_lower)
 
         return self._create_intent_result(intent, doc, entities)
 
@@ -98,25 +124,27 @@ class IntentClassifier:
         root_lemma = root_verb.lemma_.lower()
 
         # Check for count intent
-        if root_lemma in ["count", "be"] and any(
-            t.lower_ in ["many", "much", "number"] for t in doc
+        if root_lemma in COUNT_ROOT_LEMMAS and any(
+            t.lower_ in COUNT_WORDS for t in doc
         ):
             return self.INTENT_COUNT
 
         # Check for existence intent
         # Note: Multi-value field queries are already handled before this method is called
-        if root_lemma in ["have", "be", "exist", "do"]:
+        if root_lemma in EXISTS_ROOT_LEMMAS:
             # Look for question structure
-            if doc[0].lower_ in ["has", "have", "is", "are", "does", "do"]:
+            if doc[0].lower_ in EXISTS_QUESTION_WORDS:
                 return self.INTENT_EXISTS
 
         # Check for select intent
-        if root_lemma in ["show", "display", "list", "get", "find", "give", "return"]:
+        if root_lemma in SELECT_ROOT_LEMMAS:
             return self.INTENT_SELECT
 
         return None
 
-    def _is_multi_value_field_query(self, doc: Doc, entities: Dict[str, List[Dict[str, Any]]]) -> bool:
+    def _is_multi_value_field_query(
+        self, entities: Dict[str, List[Dict[str, Any]]], text_lower: str
+    ) -> bool:
         """
         Check if query is asking about multi-value fields.
 
@@ -127,54 +155,36 @@ class IntentClassifier:
         - "Find assets with active query backup_job" -> SELECT
 
         Args:
-            doc: spaCy processed document
             entities: Recognized entities from the query
+            text_lower: Lowercased query text
 
         Returns:
             True if this is a multi-value field query
         """
-        text_lower = doc.text.lower()
-
         # Check if any multi-value column is mentioned in entities
-        if entities.get("columns"):
-            for col_entity in entities["columns"]:
-                col_name = col_entity.get("column", "")
-                if col_name in MULTI_VALUE_COLUMNS or col_name in TEXT_LIST_COLUMNS:
-                    return True
-
-        # Check for multi-value field keywords in the query text
-        multi_value_keywords = {
-            # CVE/vulnerability related
-            "cve", "vulnerability", "vulnerabilities", "remediat", "patch", "fix",
-            # IP related
-            "old_ip", "old ip", "previous ip",
-            # Query/task related
-            "active_queries", "active queries", "active_tasks", "active tasks",
-            "running query", "running queries", "running task", "running tasks",
-            # Other multi-value fields
-            "children", "code_sections", "asset_insight", "insight_names",
-            "custom_information", "custom_attributes",
-        }
+        if any(
+            col_entity.get("column", "") in LIST_VALUE_COLUMNS
+            for col_entity in entities.get("columns", ())
+        ):
+            return True
 
-        # Check if any multi-value keyword is in the query
-        for keyword in multi_value_keywords:
+        # Check if any multi-value keyword is in the query text
+        for keyword in MULTI_VALUE_KEYWORDS:
             if keyword in text_lower:
                 return True
 
         return False
 
-    def _keyword_based_classification(self, doc: Doc) -> str:
+    def _keyword_based_classification(self, text_lower: str) -> str:
         """
         Classify intent based on keyword matching.
 
         Args:
-            doc: spaCy processed document
+            text_lower: Lowercased query text
 
         Returns:
             Intent type (defaults to SELECT)
         """
-        text_lower = doc.text.lower()
-
         # Check for count keywords
         for keyword in self.intent_keywords[self.INTENT_COUNT]:
             if keyword in text_lower:
@@ -184,12 +194,8 @@ class IntentClassifier:
         if text_lower.startswith(("has ", "have ", "is ", "are ", "does ", "do ")):
             return self.INTENT_EXISTS
 
-        # Check for select keywords
-        for keyword in self.intent_keywords[self.INTENT_SELECT]:
-            if keyword in text_lower:
-                return self.INTENT_SELECT
-
-        # Default to SELECT
+        # Select keywords and everything else both mean SELECT, so there is
+        # no need to scan for them
         return self.INTENT_SELECT
 
     def _create_intent_result(
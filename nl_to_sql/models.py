@@ -15,6 +15,8 @@ from spacy.tokens import Doc
 class ColumnEntity:
     """Represents a recognized column entity."""
 
+    __slots__ = ("text", "column", "start", "end")
+
     text: str
     column: str
     start: int
@@ -25,6 +27,8 @@ class ColumnEntity:
 class ValueEntity:
     """Represents a recognized value entity."""
 
+    __slots__ = ("text", "value", "type", "start", "end")
+
     text: str
     value: Any
     type: str  # 'integer', 'string', 'cve', 'ip_address', etc.
@@ -36,6 +40,8 @@ class ValueEntity:
 class OperatorEntity:
     """Represents a recognized operator entity."""
 
+    __slots__ = ("text", "operator", "start", "end")
+
     text: str
     operator: str  # 'equals', 'not_equals', 'greater', 'less', 'like', 'in'
     start: int
@@ -46,6 +52,8 @@ class OperatorEntity:
 class LogicEntity:
     """Represents a logical connector entity."""
 
+    __slots__ = ("text", "type", "start", "end")
+
     text: str
     type: str  # 'and', 'or'
     start: int
@@ -56,6 +64,8 @@ class LogicEntity:
 class IntentEntity:
     """Represents an intent entity."""
 
+    __slots__ = ("text", "type", "start", "end")
+
     text: str
     type: str  # 'show', 'count', 'exists'
     start: int
@@ -66,6 +76,8 @@ class IntentEntity:
 class QuantifierEntity:
     """Represents a quantifier entity."""
 
+    __slots__ = ("text", "type", "start", "end")
+
     text: str
     type: str  # 'all', 'any'
     start: int
@@ -149,6 +161,8 @@ class WhereCondition:
 class OrderByClause:
     """Represents an ORDER BY clause."""
 
+    __slots__ = ("column", "direction")
+
     column: str
     direction: str  # 'ASC' or 'DESC'
 
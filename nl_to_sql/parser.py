@@ -2,40 +2,114 @@
 Natural language parser using spaCy for dependency tree analysis.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, cast
 
 import spacy
 from spacy.tokens import Doc, Token
 
 from .constants import (
+    DEFAULT_DISABLED_COMPONENTS,
     MAX_LIMIT_SEARCH_DISTANCE,
     MAX_PROXIMITY_DISTANCE,
+    NLP_BATCH_SIZE,
+    NLP_N_PROCESS,
 )
 from .dependency_utils import DependencyPathFinder
 from .entity_recognizer import EntityRecognizer
-from .schema import BOOLEAN_COLUMNS
+from .schema import BOOLEAN_COLUMN_SET
+
+# Keyword cues matched against lowercase token text
+NEGATION_WORDS = frozenset({"not", "no", "never"})
+EXCLUSION_WORDS = frozenset({"excluding", "except", "without", "not"})
+GREATER_WORDS = frozenset({"greater", "more", "above", "over"})
+LESS_WORDS = frozenset({"less", "fewer", "below", "under"})
+LIKE_WORDS = frozenset({"contains", "like", "includes", "has"})
+# On a dependency path "with" also signals containment
+DEPENDENCY_LIKE_WORDS = LIKE_WORDS | {"with"}
+LIKE_PREFIX_WORDS = frozenset({"starts", "begins"})
+LIKE_SUFFIX_WORDS = frozenset({"ends", "finishes"})
+LIKE_PREPOSITIONS = frozenset({"with", "containing"})
+AFFECTED_WORDS = frozenset({"affected", "vulnerable", "impacted"})
+ORDER_WORDS = frozenset({"sort", "order", "sorted", "ordered"})
+DESCENDING_WORDS = frozenset({"desc", "descending", "reverse"})
+LIMIT_WORDS = frozenset({"limit", "top", "first"})
+
+# Dependency labels linking a column's head to a sibling value
+SIBLING_VALUE_DEPS = frozenset({"dobj", "pobj", "attr", "nummod"})
+# Dependency labels of prepositional or direct objects
+OBJECT_DEPS = frozenset({"pobj", "dobj"})
+
+# SQL operator for each recognized operator type
+SQL_OPERATORS = {
+    "equals": "=",
+    "not_equals": "!=",
+    "greater": ">",
+    "less": "<",
+    "like": "LIKE",
+    "in": "IN",
+}
 
 
 class QueryParser:
     """Parses natural language queries using spaCy's linguistic features."""
 
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    # Loaded spaCy models shared by all parser instances,
+    # keyed by (model name, disabled components)
+    _nlp_cache: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+
+    def __init__(
+        self,
+        model_name: str = "en_core_web_sm",
+        disable_components: Sequence[str] = DEFAULT_DISABLED_COMPONENTS,
+    ):
         """
         Initialize the query parser.
 
         Args:
             model_name: Name of the spaCy model to use
+            disable_components: spaCy pipeline components to disable at load.
+                Translation relies on the tagger, attribute ruler, lemmatizer
+                and dependency parser, so only unrelated components such as
+                "ner" or "textcat" should be disabled.
+        """
+        self.disable_components = tuple(disable_components)
+        self.nlp = self._load_model(model_name, self.disable_components)
+
+        self.entity_recognizer = EntityRecognizer(self.nlp)
+        self.dependency_path_finder = DependencyPathFinder()
+
+        # Most recently processed query and its document, so that parsing a
+        # query and inspecting its dependency tree share one pipeline run
+        self._last_query: Optional[str] = None
+        self._last_doc: Optional[Doc] = None
+
+    @classmethod
+    def _load_model(cls, model_name: str, disable_components: Tuple[str, ...]) -> Any:
         """
+        Load a spaCy model, reusing an already loaded instance if available.
+
+        Args:
+            model_name: Name of the spaCy model to load
+            disable_components: Pipeline components to disable
+
+        Returns:
+            spaCy language model
+        """
+        cache_key = (model_name, disable_components)
+        nlp = cls._nlp_cache.get(cache_key)
+        if nlp is not None:
+            return nlp
+
         try:
-            self.nlp = spacy.load(model_name)
+            nlp = spacy.load(model_name, disable=list(disable_components))
         except OSError as e:
             raise RuntimeError(
                 f"spaCy model '{model_name}' not found. "
                 f"Please install it with: python -m spacy download {model_name}"
             ) from e
 
-        self.entity_recognizer = EntityRecognizer(self.nlp)
-        self.dependency_path_finder = DependencyPathFinder()
+        cls._nlp_cache[cache_key] = nlp
+        return nlp
 
     def parse(self, query: str) -> Dict[str, Any]:
         """
@@ -47,7 +121,105 @@ class QueryParser:
         Returns:
             Dictionary containing parsed components
         """
-        doc = self.nlp(query)
+        return self._parse_doc(self._get_doc(query))
+
+    def parse_many(
+        self, queries: Iterable[str], batch_size: int = NLP_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parse multiple natural language queries in batches.
+
+        Runs the spaCy pipeline over all queries with nlp.pipe(), which is
+        considerably faster than processing each query separately. Single-token
+        queries skip the dependency parser (see _process_single_token()).
+
+        Args:
+            queries: Natural language query strings
+            batch_size: Number of queries processed per spaCy batch
+
+        Yields:
+            Dictionary containing parsed components for each query, in order
+        """
+        docs = [self.nlp.make_doc(query) for query in queries]
+
+        # Only multi-token documents need to go through the full pipeline
+        piped_docs = self.nlp.pipe(
+            (doc for doc in docs if len(doc) != 1),
+            batch_size=batch_size,
+            n_process=NLP_N_PROCESS,
+        )
+
+        for doc in docs:
+            if len(doc) == 1:
+                doc = self._process_single_token(doc)
+            else:
+                doc = next(piped_docs)
+            yield self._parse_doc(doc)
+
+    def _get_doc(self, query: str) -> Doc:
+        """
+        Process a query, reusing the document of the previous call if the text matches.
+
+        Args:
+            query: Natural language query string
+
+        Returns:
+            spaCy processed document
+        """
+        if self._last_doc is None or query != self._last_query:
+            self._last_doc = self._process(self.nlp.make_doc(query))
+            self._last_query = query
+        return self._last_doc
+
+    def _process(self, doc: Doc) -> Doc:
+        """
+        Run the spaCy pipeline over a tokenized document.
+
+        Args:
+            doc: Tokenized document
+
+        Returns:
+            Processed document
+        """
+        if len(doc) == 1:
+            return self._process_single_token(doc)
+        return cast(Doc, self.nlp(doc))
+
+    def _process_single_token(self, doc: Doc) -> Doc:
+        """
+        Run the spaCy pipeline over a single-token document, skipping the parser.
+
+        Short prompts such as a bare IP address are common, and for them the
+        dependency parse carries no information: a lone token is always the
+        ROOT of its own tree. The parse is filled in directly instead of
+        running the parser model.
+
+        Args:
+            doc: Tokenized document containing exactly one token
+
+        Returns:
+            Processed document
+        """
+        for name, component in self.nlp.pipeline:
+            if name != "parser":
+                doc = component(doc)
+
+        if "parser" in self.nlp.pipe_names:
+            doc[0].dep_ = "ROOT"
+
+        return doc
+
+    def _parse_doc(self, doc: Doc) -> Dict[str, Any]:
+        """
+        Extract query components from an already processed document.
+
+        Args:
+            doc: spaCy processed document
+
+        Returns:
+            Dictionary containing parsed components
+        """
+        self.dependency_path_finder.reset_for_doc(doc)
         entities = self.entity_recognizer.recognize(doc)
 
         # Analyze dependency structure
@@ -138,6 +310,7 @@ class QueryParser:
         conditions = []
         doc_len = len(doc)
         used_values = set()  # Track which values have been used
+        value_positions = {v["start"]: v for v in entities["values"]}
 
         for col_entity in entities["columns"]:
             col_idx = col_entity["start"]
@@ -151,7 +324,7 @@ class QueryParser:
 
             # Try dependency-based matching first
             related_values = self._find_related_values_by_dependency(
-                col_token, doc, entities
+                col_token, value_positions
             )
 
             if related_values:
@@ -203,6 +376,7 @@ class QueryParser:
             List of condition dictionaries
         """
         conditions = []
+        seen = set()
 
         for val_entity in related_values:
             val_idx = val_entity["start"]
@@ -219,14 +393,15 @@ class QueryParser:
             if val_entity.get("type") == "ip_prefix" and column_name == "ipv4":
                 operator = "LIKE"
 
-            condition = {
-                "column": column_name,
-                "operator": operator,
-                "value": val_entity["value"],
-            }
-
-            if condition not in conditions:
-                conditions.append(condition)
+            # Values are scalars, so (operator, value) identifies the condition
+            key = (operator, val_entity["value"])
+            if key not in seen:
+                seen.add(key)
+                conditions.append({
+                    "column": column_name,
+                    "operator": operator,
+                    "value": val_entity["value"],
+                })
 
         return conditions
 
@@ -255,6 +430,8 @@ class QueryParser:
             used_values = set()
             
         conditions = []
+        seen = set()
+        max_distance = MAX_PROXIMITY_DISTANCE
 
         for val_entity in entities["values"]:
             val_idx = val_entity["start"]
@@ -264,13 +441,14 @@ class QueryParser:
                 continue
 
             # Check if value is reasonably close to column
-            if abs(val_idx - col_idx) <= MAX_PROXIMITY_DISTANCE:
+            distance = abs(val_idx - col_idx)
+            if distance <= max_distance:
                 # Check if there's another column closer to this value
                 closer_column = False
                 for other_col in entities["columns"]:
                     if other_col["column"] != column_name:
                         other_dist = abs(val_idx - other_col["start"])
-                        if other_dist < abs(val_idx - col_idx):
+                        if other_dist < distance:
                             closer_column = True
                             break
                 
@@ -286,14 +464,14 @@ class QueryParser:
                 if val_entity.get("type") == "ip_prefix" and column_name == "ipv4":
                     operator = "LIKE"
 
-                condition = {
-                    "column": column_name,
-                    "operator": operator,
-                    "value": val_entity["value"],
-                }
-
-                if condition not in conditions:
-                    conditions.append(condition)
+                key = (operator, val_entity["value"])
+                if key not in seen:
+                    seen.add(key)
+                    conditions.append({
+                        "column": column_name,
+                        "operator": operator,
+                        "value": val_entity["value"],
+                    })
 
         return conditions
 
@@ -301,7 +479,11 @@ class QueryParser:
         self, doc: Doc, entities: Dict[str, List[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """
-        Extract conditions for boolean columns without explicit values.
+        Extract conditions for boolean columns.
+
+        A column directly compared with a boolean value (e.g. "approved is
+        not true") takes that comparison; otherwise the column alone means
+        true unless it is negated or excluded.
 
         Args:
             doc: spaCy processed document
@@ -321,7 +503,12 @@ class QueryParser:
             if col_idx < 0 or col_idx >= doc_len:
                 continue
 
-            if column_name not in BOOLEAN_COLUMNS:
+            if column_name not in BOOLEAN_COLUMN_SET:
+                continue
+
+            comparison = self._find_boolean_comparison(col_entity, entities)
+            if comparison is not None:
+                conditions.append(comparison)
                 continue
 
             # Check for negation or exclusion
@@ -336,6 +523,48 @@ class QueryParser:
 
         return conditions
     
+    def _find_boolean_comparison(
+        self,
+        col_entity: Dict[str, Any],
+        entities: Dict[str, List[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find an explicit comparison of a column with a boolean value.
+
+        Matches an operator right after the column followed by a boolean
+        value, as in "approved is not true" or "approved equals false".
+
+        Args:
+            col_entity: Column entity
+            entities: Recognized entities
+
+        Returns:
+            Condition dictionary, or None if the column is not compared
+        """
+        operators = [
+            op_entity
+            for op_entity in entities["operators"]
+            if op_entity["start"] == col_entity["end"]
+        ]
+        if not operators:
+            return None
+
+        # "is not" also contains the equals operator "is"; take the longest
+        operator = max(operators, key=lambda op_entity: op_entity["end"])
+
+        for val_entity in entities["values"]:
+            if (
+                val_entity["start"] == operator["end"]
+                and val_entity["type"] == "boolean"
+            ):
+                return {
+                    "column": col_entity["column"],
+                    "operator": self._map_operator(operator["operator"]),
+                    "value": val_entity["value"],
+                }
+
+        return None
+
     def _is_excluded(self, token: Token, doc: Doc) -> bool:
         """
         Check if a token is preceded by 'excluding' or similar exclusion terms.
@@ -349,7 +578,7 @@ class QueryParser:
         """
         # Look for "excluding", "except", "without" before the token
         for i in range(max(0, token.i - 3), token.i):
-            if doc[i].lower_ in ["excluding", "except", "without", "not"]:
+            if doc[i].lower_ in EXCLUSION_WORDS:
                 return True
         return False
     
@@ -371,9 +600,19 @@ class QueryParser:
         # Handle vendor filters
         for vendor_entity in entities.get("vendors", []):
             vendor_name = vendor_entity["vendor"]
+
+            # "vendor is not siemens": a "not equals" operator just before
+            # the vendor (allowing one word, as in "not equal to") excludes it
+            vendor_start = vendor_entity["start"]
+            is_negated = any(
+                op_entity["operator"] == "not_equals"
+                and 0 <= vendor_start - op_entity["end"] <= 1
+                for op_entity in entities.get("operators", [])
+            )
+
             conditions.append({
                 "column": "vendor",
-                "operator": "LIKE",
+                "operator": "!=" if is_negated else "LIKE",
                 "value": vendor_name,
             })
         
@@ -451,10 +690,14 @@ class QueryParser:
         Returns:
             Operator string
         """
-        # Check for explicit operators between column and value
+        # Check for explicit operators between column and value; "is not"
+        # also contains the equals operator "is", so negation goes first
         start = min(col_idx, val_idx)
         end = max(col_idx, val_idx)
 
+        if self._has_not_equals_operator(entities, start, end):
+            return "!="
+
         for op_entity in entities["operators"]:
             if start <= op_entity["start"] <= end:
                 op_type = op_entity["operator"]
@@ -475,7 +718,7 @@ class QueryParser:
 
         # Check for "like" patterns (contains, includes)
         for token in doc[start:end]:
-            if token.lower_ in ["contains", "like", "includes", "has"]:
+            if token.lower_ in LIKE_WORDS:
                 return "LIKE"
 
         # Default to equality
@@ -483,15 +726,27 @@ class QueryParser:
 
     def _map_operator(self, op_type: str) -> str:
         """Map operator type to SQL operator."""
-        mapping = {
-            "equals": "=",
-            "not_equals": "!=",
-            "greater": ">",
-            "less": "<",
-            "like": "LIKE",
-            "in": "IN",
-        }
-        return mapping.get(op_type, "=")
+        return SQL_OPERATORS.get(op_type, "=")
+
+    @staticmethod
+    def _has_not_equals_operator(
+        entities: Dict[str, List[Dict[str, Any]]], start: int, end: int
+    ) -> bool:
+        """
+        Check if a "not equals" operator (e.g. "is not") starts in a token range.
+
+        Args:
+            entities: Recognized entities
+            start: First token index (inclusive)
+            end: Last token index (inclusive)
+
+        Returns:
+            True if such an operator is found
+        """
+        return any(
+            op_entity["operator"] == "not_equals" and start <= op_entity["start"] <= end
+            for op_entity in entities.get("operators", [])
+        )
 
     def _is_negated(self, token: Token) -> bool:
         """Check if a token is negated."""
@@ -502,7 +757,7 @@ class QueryParser:
 
         # Check if token has a negation ancestor
         for ancestor in token.ancestors:
-            if ancestor.lower_ in ["not", "no", "never"]:
+            if ancestor.lower_ in NEGATION_WORDS:
                 return True
 
         return False
@@ -561,7 +816,7 @@ class QueryParser:
 
         # Look for ordering keywords
         for token in doc:
-            if token.lower_ in ["sort", "order", "sorted", "ordered"]:
+            if token.lower_ in ORDER_WORDS:
                 # Look for "by" and column name
                 for child in token.children:
                     if child.lower_ == "by":
@@ -571,7 +826,7 @@ class QueryParser:
                                 direction = "ASC"
                                 # Check for desc/descending
                                 for t in doc[child.i:col_entity["end"] + 3]:
-                                    if t.lower_ in ["desc", "descending", "reverse"]:
+                                    if t.lower_ in DESCENDING_WORDS:
                                         direction = "DESC"
 
                                 order_by.append({
@@ -595,13 +850,15 @@ class QueryParser:
         Returns:
             Limit value or None
         """
+        max_distance = MAX_LIMIT_SEARCH_DISTANCE
+
         # Look for "limit", "top", "first" keywords
         for i, token in enumerate(doc):
-            if token.lower_ in ["limit", "top", "first"]:
+            if token.lower_ in LIMIT_WORDS:
                 # Look for a number nearby
                 for val_entity in entities["values"]:
                     if (val_entity["type"] == "integer" and
-                        abs(val_entity["start"] - i) <= MAX_LIMIT_SEARCH_DISTANCE):
+                        abs(val_entity["start"] - i) <= max_distance):
                         limit_val = val_entity["value"]
                         if isinstance(limit_val, int):
                             return limit_val
@@ -609,7 +866,7 @@ class QueryParser:
         return None
 
     def _find_related_values_by_dependency(
-        self, col_token: Token, doc: Doc, entities: Dict[str, List[Dict[str, Any]]]
+        self, col_token: Token, value_positions: Dict[int, Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
         Find values related to a column using dependency tree analysis.
@@ -622,49 +879,49 @@ class QueryParser:
 
         Args:
             col_token: The token representing the column
-            doc: spaCy document
-            entities: Recognized entities
+            value_positions: Value entities keyed by their start index
 
         Returns:
             List of related value entities
         """
-        related_values = []
-        value_positions = {v["start"]: v for v in entities["values"]}
+        # Indices of related values; strategies often reach the same value
+        related_indices = []
 
         # Strategy 1: Check direct children and descendants
         for child in col_token.children:
             if child.i in value_positions:
-                related_values.append(value_positions[child.i])
+                related_indices.append(child.i)
 
             # Check grandchildren for prepositional phrases
             for grandchild in child.children:
                 if grandchild.i in value_positions:
-                    related_values.append(value_positions[grandchild.i])
+                    related_indices.append(grandchild.i)
 
         # Strategy 2: Check ancestors (column might be dependent on value)
         for ancestor in col_token.ancestors:
             # Look for values in ancestor's children
             for sibling in ancestor.children:
                 if sibling.i in value_positions and sibling.i != col_token.i:
-                    related_values.append(value_positions[sibling.i])
+                    related_indices.append(sibling.i)
 
         # Strategy 3: Check siblings (parallel structure)
         if col_token.head:
             for sibling in col_token.head.children:
                 if sibling.i in value_positions and sibling.i != col_token.i:
                     # Check if they're in a reasonable relationship
-                    if sibling.dep_ in ["dobj", "pobj", "attr", "nummod"]:
-                        related_values.append(value_positions[sibling.i])
+                    if sibling.dep_ in SIBLING_VALUE_DEPS:
+                        related_indices.append(sibling.i)
 
         # Strategy 4: Find values connected via prepositions
-        for token in doc:
-            if token.dep_ == "prep" and token.head == col_token:
+        for token in col_token.children:
+            if token.dep_ == "prep":
                 # Look for values after the preposition
                 for child in token.children:
                     if child.i in value_positions:
-                        related_values.append(value_positions[child.i])
+                        related_indices.append(child.i)
 
-        return related_values
+        # Keep the first occurrence of each value, in discovery order
+        return [value_positions[i] for i in dict.fromkeys(related_indices)]
 
     def _infer_operator_from_dependency(
         self,
@@ -690,38 +947,47 @@ class QueryParser:
         Returns:
             SQL operator string
         """
+        # An explicit "not equals" operator between column and value (e.g.
+        # "is not") negates the condition whatever the parse looks like
+        start = min(col_token.i, val_token.i)
+        end = max(col_token.i, val_token.i)
+        if self._has_not_equals_operator(entities, start, end):
+            return "!="
+
         # Check for explicit operators in the dependency path
         path_tokens = self.dependency_path_finder.find_path(col_token, val_token)
 
         for token in path_tokens:
+            lower = token.lower_
+
             # Check for negation
-            if token.lower_ in ["not", "no", "never"] or token.dep_ == "neg":
+            if lower in NEGATION_WORDS or token.dep_ == "neg":
                 return "!="
 
             # Check for comparison keywords
-            if token.lower_ in ["greater", "more", "above", "over"]:
+            if lower in GREATER_WORDS:
                 return ">"
-            if token.lower_ in ["less", "fewer", "below", "under"]:
+            if lower in LESS_WORDS:
                 return "<"
-            if token.lower_ in ["contains", "like", "includes", "has", "with"]:
+            if lower in DEPENDENCY_LIKE_WORDS:
                 return "LIKE"
-            if token.lower_ in ["starts", "begins"]:
+            if lower in LIKE_PREFIX_WORDS:
                 return "LIKE"  # Will be formatted as 'value%'
-            if token.lower_ in ["ends", "finishes"]:
+            if lower in LIKE_SUFFIX_WORDS:
                 return "LIKE"  # Will be formatted as '%value'
 
         # Check dependency labels
-        if val_token.dep_ in ["pobj", "dobj"]:
+        if val_token.dep_ in OBJECT_DEPS:
             # Check if there's a preposition
             if val_token.head.pos_ == "ADP":
                 prep = val_token.head.lower_
                 if prep == "in":
                     return "="
-                elif prep in ["with", "containing"]:
+                elif prep in LIKE_PREPOSITIONS:
                     return "LIKE"
 
         # Check for "affected by", "vulnerable to" patterns
-        if col_token.head.lower_ in ["affected", "vulnerable", "impacted"]:
+        if col_token.head.lower_ in AFFECTED_WORDS:
             return "LIKE"  # For CVE and vulnerability queries
 
         # Default to equality
@@ -738,7 +1004,16 @@ class QueryParser:
         Returns:
             Dictionary with dependency tree information
         """
-        doc = self.nlp(query)
+        # Work on a copy so the cached document used for translation is
+        # left untouched
+        doc = self._get_doc(query).copy()
+
+        # Also run components this parser disabled for translation (e.g. NER)
+        # so the debugging output reflects the full model. Components the
+        # model itself disables by default (e.g. senter) stay off.
+        for name, component in self.nlp.components:
+            if name in self.disable_components and name in self.nlp.disabled:
+                doc = component(doc)
 
         tree_info: Dict[str, Any] = {
             "tokens": [],
@@ -200,12 +200,18 @@ COLUMN_SYNONYMS = {
 # Get all valid column names
 VALID_COLUMNS = list(ASSETS_TABLE["columns"].keys())
 
+# Valid column names, for fast membership tests
+VALID_COLUMN_SET = frozenset(VALID_COLUMNS)
+
 # Boolean columns
 BOOLEAN_COLUMNS = [
     col for col, props in ASSETS_TABLE["columns"].items()
     if props["type"] == "BOOLEAN"
 ]
 
+# Boolean column names, for fast membership tests
+BOOLEAN_COLUMN_SET = frozenset(BOOLEAN_COLUMNS)
+
 # Numeric columns
 NUMERIC_COLUMNS = [
     col for col, props in ASSETS_TABLE["columns"].items()
@@ -251,3 +257,6 @@ TEXT_LIST_COLUMNS = [
     "project_parsed",
 ]
 
+# Columns that may hold several values (multi-value or text list columns)
+LIST_VALUE_COLUMNS = frozenset(MULTI_VALUE_COLUMNS) | frozenset(TEXT_LIST_COLUMNS)
+
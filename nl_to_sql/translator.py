@@ -2,9 +2,16 @@
 Main translator interface for converting natural language to SQL queries.
 """
 
+import copy
 import json
-from typing import Any, Dict, Literal
-
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Literal, Sequence, Tuple, cast
+
+from .constants import (
+    DEFAULT_DISABLED_COMPONENTS,
+    NLP_BATCH_SIZE,
+    TRANSLATION_CACHE_SIZE,
+)
 from .intent_classifier import IntentClassifier
 from .parser import QueryParser
 from .query_builder import QueryBuilder
@@ -27,6 +34,8 @@ class NLToSQLTranslator:
         model_name: str = "en_core_web_sm",
         table_name: str = "assets",
         output_format: OutputFormat = "sql",
+        disable_components: Sequence[str] = DEFAULT_DISABLED_COMPONENTS,
+        cache_size: int = TRANSLATION_CACHE_SIZE,
     ):
         """
         Initialize the translator.
@@ -35,12 +44,22 @@ class NLToSQLTranslator:
             model_name: Name of the spaCy model to use
             table_name: Name of the database table
             output_format: Default output format ("sql", "json", or "both")
+            disable_components: spaCy pipeline components to disable at load
+                (default: "ner" and "textcat", which translation never uses)
+            cache_size: Maximum number of translations to cache by query
+                string (0 disables caching)
         """
-        self.parser = QueryParser(model_name=model_name)
+        self.parser = QueryParser(
+            model_name=model_name, disable_components=disable_components
+        )
         self.intent_classifier = IntentClassifier()
         self.query_builder = QueryBuilder(table_name=table_name)
         self.output_format = output_format
 
+        # Least recently used translations, keyed by query string
+        self.cache_size = cache_size
+        self._translation_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
     def translate(self, query: str) -> Dict[str, Any]:
         """
         Translate a natural language query to a JSON SQL representation.
@@ -63,18 +82,53 @@ class NLToSQLTranslator:
                 "limit": None
             }
         """
-        # Step 1: Parse the query
-        parsed_data = self.parser.parse(query)
+        return copy.deepcopy(self._translate_cached(query)["query"])
+
+    def translate_many(
+        self, queries: Iterable[str], batch_size: int = NLP_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate multiple natural language queries to JSON SQL representations.
+
+        All queries are run through spaCy in batches, which is considerably
+        faster than calling translate() for each query.
+
+        Args:
+            queries: Natural language query strings
+            batch_size: Number of queries processed per spaCy batch
+
+        Returns:
+            List of JSON query representations, in the same order as the queries
+
+        Example:
+            >>> translator = NLToSQLTranslator()
+            >>> results = translator.translate_many(["Show me all assets", "Count assets"])
+            >>> len(results)
+            2
+        """
+        return [
+            self._translate_parsed(parsed_data)[0]
+            for parsed_data in self.parser.parse_many(queries, batch_size=batch_size)
+        ]
+
+    def _translate_parsed(
+        self, parsed_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Classify the intent of a parsed query and build its JSON representation.
 
-        # Step 2: Classify the intent
+        Args:
+            parsed_data: Parsed query components from QueryParser
+
+        Returns:
+            Tuple of (JSON query representation, intent classification)
+        """
         intent = self.intent_classifier.classify(
             parsed_data["doc"], parsed_data["entities"]
         )
-
-        # Step 3: Build the JSON query
         query_json = self.query_builder.build(parsed_data, intent)
 
-        return query_json
+        return query_json, intent
 
     def translate_to_sql(self, query: str) -> str:
         """
@@ -92,8 +146,7 @@ class NLToSQLTranslator:
             >>> print(sql)
             SELECT * FROM assets WHERE site = 54
         """
-        query_json = self.translate(query)
-        return self.query_builder.to_sql(query_json)
+        return cast(str, self._translate_cached(query)["sql"])
     
     def translate_with_format(
         self, 
@@ -135,18 +188,18 @@ class NLToSQLTranslator:
         if output_format is None:
             output_format = self.output_format
         
-        # Get JSON representation
-        query_json = self.translate(query)
+        # Get the cached translation, which already holds the rendered SQL
+        details = self._translate_cached(query)
         
         # Return based on format
         if output_format == "sql":
-            return self.query_builder.to_sql(query_json)
+            return cast(str, details["sql"])
         elif output_format == "json":
-            return query_json
+            return cast(Dict[str, Any], copy.deepcopy(details["query"]))
         elif output_format == "both":
             return {
-                "sql": self.query_builder.to_sql(query_json),
-                "json": query_json
+                "sql": details["sql"],
+                "json": copy.deepcopy(details["query"])
             }
         else:
             raise ValueError(f"Invalid output_format: {output_format}. Must be 'sql', 'json', or 'both'")
@@ -212,16 +265,106 @@ class NLToSQLTranslator:
             >>> print(result["intent"]["type"])
             select
         """
-        # Parse the query
-        parsed_data = self.parser.parse(query)
+        return copy.deepcopy(self._translate_cached(query))
 
-        # Classify the intent
-        intent = self.intent_classifier.classify(
-            parsed_data["doc"], parsed_data["entities"]
+    def clear_cache(self) -> None:
+        """Discard all cached translations."""
+        self._translation_cache.clear()
+
+    def _translate_cached(self, query: str) -> Dict[str, Any]:
+        """
+        Get the detailed translation of a query, reusing a cached result if any.
+
+        The returned dictionary is shared with the cache, so callers must copy
+        it before handing it out.
+
+        Args:
+            query: Natural language query string
+
+        Returns:
+            Dictionary with the same structure as translate_with_details()
+        """
+        cache = self._translation_cache
+        details = cache.get(query)
+        if details is not None:
+            cache.move_to_end(query)
+            return details
+
+        # Parse the query, classify its intent and build the JSON query
+        details = self._build_details(self.parser.parse(query))
+
+        if self.cache_size > 0:
+            cache[query] = details
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        return details
+
+    def translate_many_with_details(
+        self, queries: Iterable[str], batch_size: int = NLP_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate multiple queries and return detailed information for each.
+
+        All queries are run through spaCy in batches, which is considerably
+        faster than calling translate_with_details() for each query.
+
+        Args:
+            queries: Natural language query strings
+            batch_size: Number of queries processed per spaCy batch
+
+        Returns:
+            List of dictionaries with the same structure as
+            translate_with_details(), in the same order as the queries
+        """
+        return [
+            self._build_details(parsed_data)
+            for parsed_data in self.parser.parse_many(queries, batch_size=batch_size)
+        ]
+
+    def translate_many_tagged(
+        self,
+        tagged_queries: Iterable[Tuple[str, Any]],
+        batch_size: int = NLP_BATCH_SIZE,
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Translate (query, tag) pairs in one batch, keeping each tag with its result.
+
+        Works like translate_many_with_details(), but lets callers attach
+        arbitrary context (such as a category) to every query, similar to
+        spaCy's nlp.pipe(..., as_tuples=True).
+
+        Args:
+            tagged_queries: Pairs of natural language query and tag
+            batch_size: Number of queries processed per spaCy batch
+
+        Returns:
+            List of (details, tag) pairs in the same order as the input, where
+            details has the same structure as translate_with_details()
+
+        Example:
+            >>> translator = NLToSQLTranslator()
+            >>> pairs = [("Show me all assets", "discovery"), ("high risk", "security")]
+            >>> for details, tag in translator.translate_many_tagged(pairs):
+            ...     print(tag, details["sql"])
+        """
+        tagged_queries = list(tagged_queries)
+        results = self.translate_many_with_details(
+            (query for query, _ in tagged_queries), batch_size=batch_size
         )
+        return [(details, tag) for details, (_, tag) in zip(results, tagged_queries)]
 
-        # Build the JSON query
-        query_json = self.query_builder.build(parsed_data, intent)
+    def _build_details(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the detailed translation result for a parsed query.
+
+        Args:
+            parsed_data: Parsed query components from QueryParser
+
+        Returns:
+            Dictionary containing query JSON, SQL, intent, and parsed entities
+        """
+        query_json, intent = self._translate_parsed(parsed_data)
 
         return {
             "query": query_json,
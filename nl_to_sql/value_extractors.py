@@ -7,18 +7,27 @@ into smaller, focused extractor classes.
 
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from spacy.symbols import NOUN, NUM, PROPN
 from spacy.tokens import Doc, Token
 
-# Constants for CVE pattern matching
-CVE_TOKEN_LOOKAHEAD = 2  # CVE pattern spans 3 tokens: "CVE-2017", "-", "12819"
-CVE_PATTERN_PARTS = 3  # Total tokens in multi-token CVE pattern
+from .constants import VALUE_CHECK_CACHE_SIZE
+from .schema import VALID_COLUMN_SET
 
 # Constants for IP address validation
 IPV4_OCTET_COUNT = 4  # Full IPv4 address has 4 octets
 IPV4_MIN_OCTETS = 2  # Minimum octets for partial IP pattern (e.g., "10.89")
 
+# Precompiled value patterns, shared by all extractors
+CVE_PATTERN = re.compile(r'^CVE-\d{4}-\d{4,}$', re.IGNORECASE)
+# CVE identifiers anywhere in the text, not glued to surrounding words
+CVE_SEARCH_PATTERN = re.compile(r'(?<![\w-])CVE-\d{4}-\d{4,}(?![\w-])', re.IGNORECASE)
+MAC_PATTERN = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+# Found in every CVE, IP, MAC and quoted string token (see requires_value_shape)
+VALUE_SHAPE_PATTERN = re.compile(r'^["\']|[.:-]')
+
 
 class ExtractionContext:
     """Context object to manage entity extraction state."""
@@ -79,9 +88,7 @@ class ExtractionContext:
             >>> context.add_column("site", "site", 2)  # Duplicate
             False
         """
-        from .schema import VALID_COLUMNS
-
-        if column not in VALID_COLUMNS:
+        if column not in VALID_COLUMN_SET:
             return False
 
         if (column, position) in self.added_columns:
@@ -127,6 +134,10 @@ class ExtractionContext:
 class BaseValueExtractor(ABC):
     """Base class for value extractors."""
 
+    # True if the extractor only accepts tokens whose text contains
+    # VALUE_SHAPE_PATTERN, so other tokens can skip it
+    requires_value_shape = False
+
     @abstractmethod
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """
@@ -145,7 +156,8 @@ class BaseValueExtractor(ABC):
 class CVEValueExtractor(BaseValueExtractor):
     """Extracts CVE identifiers."""
 
-    CVE_PATTERN = re.compile(r'^CVE-\d{4}-\d{4,}$', re.IGNORECASE)
+    CVE_PATTERN = CVE_PATTERN
+    requires_value_shape = True
 
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """Extract CVE identifier from token."""
@@ -156,14 +168,18 @@ class CVEValueExtractor(BaseValueExtractor):
         context.add_column("CVE", "CVE", token.i)
         return True
 
-    def _is_cve_identifier(self, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=VALUE_CHECK_CACHE_SIZE)
+    def _is_cve_identifier(text: str) -> bool:
         """Check if text is a CVE identifier."""
-        return bool(self.CVE_PATTERN.match(text))
+        return bool(CVE_PATTERN.match(text))
 
 
 class IPValueExtractor(BaseValueExtractor):
     """Extracts IP addresses."""
 
+    requires_value_shape = True
+
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """Extract IP address from token."""
         ip_value, is_prefix = self._parse_ip_address(token.text)
@@ -183,7 +199,8 @@ class IPValueExtractor(BaseValueExtractor):
         Returns:
             Tuple of (ip_value, is_prefix)
         """
-        if not isinstance(text, str):
+        # Anything without a dot has a single part and can never be an IP
+        if "." not in text:
             return (None, False)
 
         parts = text.split('.')
@@ -222,7 +239,8 @@ class IPValueExtractor(BaseValueExtractor):
 class MACValueExtractor(BaseValueExtractor):
     """Extracts MAC addresses."""
 
-    MAC_PATTERN = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+    MAC_PATTERN = MAC_PATTERN
+    requires_value_shape = True
 
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """Extract MAC address from token."""
@@ -232,9 +250,11 @@ class MACValueExtractor(BaseValueExtractor):
         context.add_value(token.text, token.text, "mac_address", token.i, token.i + 1)
         return True
 
-    def _is_mac_address(self, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=VALUE_CHECK_CACHE_SIZE)
+    def _is_mac_address(text: str) -> bool:
         """Check if text looks like a MAC address."""
-        return bool(self.MAC_PATTERN.match(text))
+        return bool(MAC_PATTERN.match(text))
 
 
 class NumericValueExtractor(BaseValueExtractor):
@@ -245,7 +265,7 @@ class NumericValueExtractor(BaseValueExtractor):
 
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """Extract numeric value from token."""
-        if not (token.like_num or token.pos_ == "NUM"):
+        if not (token.like_num or token.pos == NUM):
             return False
         
         # Skip single letter tokens that aren't actually numbers
@@ -274,6 +294,8 @@ class NumericValueExtractor(BaseValueExtractor):
 class QuotedStringValueExtractor(BaseValueExtractor):
     """Extracts quoted strings."""
 
+    requires_value_shape = True
+
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """Extract quoted string from token."""
         if not (token.text.startswith('"') or token.text.startswith("'")):
@@ -302,7 +324,7 @@ class ProperNounValueExtractor(BaseValueExtractor):
 
     def extract(self, token: Token, context: ExtractionContext) -> bool:
         """Extract proper noun from token."""
-        if token.pos_ != "PROPN":
+        if token.pos != PROPN:
             return False
         
         # Skip stop words
@@ -331,13 +353,13 @@ class IdentifierNounValueExtractor(BaseValueExtractor):
 
     def _is_identifier_noun(self, token: Token) -> bool:
         """Check if token is a noun that looks like an identifier."""
-        return token.pos_ == "NOUN" and any(c.isdigit() for c in token.text)
+        return token.pos == NOUN and any(c.isdigit() for c in token.text)
 
 
 class CVESpanProcessor:
     """Processes multi-token CVE spans."""
 
-    CVE_PATTERN = re.compile(r'^CVE-\d{4}-\d{4,}$', re.IGNORECASE)
+    CVE_SEARCH_PATTERN = CVE_SEARCH_PATTERN
 
     def process(
         self, cve_spans: List[Tuple[int, int, str]], context: ExtractionContext
@@ -366,6 +388,10 @@ class CVESpanProcessor:
         CVE identifiers like "CVE-2017-12819" are often tokenized as multiple tokens.
         SpaCy typically tokenizes as: "CVE-2017", "-", "12819"
 
+        Rather than stitching tokens back together, the document text is scanned
+        once for CVE identifiers and each match is mapped back to the tokens it
+        covers. Matches that do not line up with token boundaries are ignored.
+
         Args:
             doc: spaCy processed document
 
@@ -373,28 +399,12 @@ class CVESpanProcessor:
             List of (start_idx, end_idx, cve_text) tuples
         """
         cve_spans = []
-        i = 0
-        while i < len(doc):
-            # Look for CVE pattern: "CVE-YYYY", "-", "NNNNN"
-            if i + CVE_TOKEN_LOOKAHEAD < len(doc):
-                # Check if first token starts with CVE and contains a dash and year
-                if doc[i].text.startswith("CVE-") and doc[i + 1].text == "-":
-                    # Combine the three tokens
-                    combined = doc[i].text + doc[i + 1].text + doc[i + 2].text
-
-                    # Check if it matches CVE pattern
-                    if self.CVE_PATTERN.match(combined):
-                        cve_spans.append((i, i + CVE_PATTERN_PARTS, combined))
-                        i += CVE_PATTERN_PARTS
-                        continue
-
-            # Also check for single-token CVE (less common but possible)
-            if self.CVE_PATTERN.match(doc[i].text):
-                cve_spans.append((i, i + 1, doc[i].text))
-                i += 1
+        for match in self.CVE_SEARCH_PATTERN.finditer(doc.text):
+            span = doc.char_span(match.start(), match.end())
+            if span is None:
                 continue
 
-            i += 1
+            cve_spans.append((span.start, span.end, match.group()))
 
         return cve_spans
 
@@ -413,6 +423,13 @@ class ValueExtractor:
             ProperNounValueExtractor(),
             IdentifierNounValueExtractor(),
         ]
+
+        # Chain for tokens without a value shape, which only the extractors
+        # looking at token attributes can accept
+        self.shapeless_extractors = [
+            extractor for extractor in self.extractors
+            if not extractor.requires_value_shape
+        ]
         self.cve_span_processor = CVESpanProcessor()
 
     def extract_all(
@@ -435,13 +452,20 @@ class ValueExtractor:
         if cve_spans:
             self.cve_span_processor.process(cve_spans, context)
 
-        # Process each token through the chain
+        # Process each token through the chain; only tokens covered by a
+        # CVE span are skipped, so the check is needed only if there are any
         for token in doc:
-            if context.should_skip_token(token):
+            if cve_spans and context.should_skip_token(token):
                 continue
 
+            # One regex check rules out the text-shaped extractors for most tokens
+            if VALUE_SHAPE_PATTERN.search(token.text):
+                extractors = self.extractors
+            else:
+                extractors = self.shapeless_extractors
+
             # Chain of responsibility: first extractor that succeeds stops the chain
-            for extractor in self.extractors:
+            for extractor in extractors:
                 if extractor.extract(token, context):
                     break
 
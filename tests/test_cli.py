@@ -0,0 +1,41 @@
+"""
+Tests for the nl2sql command-line tool.
+"""
+
+import pytest
+
+import nl2sql
+
+
+class TestWriteJson:
+    """Test JSON output of the command-line tool."""
+
+    DATA = {
+        "table": "assets",
+        "select": ["*"],
+        "where": [
+            {"column": "vendor", "operator": "=", "value": "Schneider Électric"}
+        ],
+        "order_by": [],
+        "limit": None,
+        "approved": True,
+    }
+
+    def _write(self, capsysbinary, pretty):
+        """Write DATA with write_json and return the bytes sent to stdout."""
+        nl2sql.write_json(self.DATA, pretty=pretty)
+        return capsysbinary.readouterr().out
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_orjson_and_standard_library_output_match(
+        self, capsysbinary, monkeypatch, pretty
+    ):
+        """Test that output does not depend on whether orjson is installed."""
+        pytest.importorskip("orjson")
+        with_orjson = self._write(capsysbinary, pretty)
+
+        monkeypatch.setattr(nl2sql, "orjson", None)
+        without_orjson = self._write(capsysbinary, pretty)
+
+        assert without_orjson == with_orjson
+        assert "Électric".encode() in without_orjson
@@ -2,8 +2,14 @@
 Extended tests for NLToSQLTranslator - covering debugging and explanation features.
 """
 
+import copy
+import importlib
+
 import pytest
-from nl_to_sql import NLToSQLTranslator
+from spacy.tokens import Doc
+
+from nl_to_sql import NLToSQLTranslator, constants
+from nl_to_sql.dependency_utils import DependencyPathFinder
 
 
 class TestTranslatorDebugFeatures:
@@ -157,6 +163,15 @@ class TestTranslatorDebugFeatures:
         assert "noun_chunks" in tree
         assert "entities" in tree
 
+    def test_analyze_dependency_tree_leaves_parsing_unchanged(self, translator):
+        """Test that inspecting the tree does not alter the parsed query."""
+        query = "Show assets from vendor Siemens in site 54"
+        before = translator.parser.parse(query)
+
+        translator.analyze_dependency_tree(query)
+
+        assert translator.parser.parse(query) == before
+
 
 class TestTranslatorEdgeCases:
     """Test edge cases and error handling."""
@@ -222,3 +237,258 @@ class TestTranslatorEdgeCases:
         # Second should have approved condition
         assert any(c["column"] == "approved" for c in result2["where"])
 
+    def test_not_equals_operator_is_not_a_boolean_value(self, translator):
+        """Test that "not" inside "is not" is only recognized as an operator."""
+        result = translator.translate_with_details("Show assets where vendor is not siemens")
+        entities = result["entities"]
+
+        assert any(o["operator"] == "not_equals" for o in entities["operators"])
+        assert not any(v["type"] == "boolean" for v in entities["values"])
+
+    @pytest.mark.parametrize("query", ["routers", "cve"])
+    def test_single_token_query_matches_full_pipeline(
+        self, translator, monkeypatch, query
+    ):
+        """Test that skipping the parser for one token keeps the parse and SQL."""
+        full = NLToSQLTranslator()
+        monkeypatch.setattr(full.parser, "_process_single_token", full.parser.nlp)
+
+        tokens = translator.analyze_dependency_tree(query)["tokens"]
+        parsed = translator.parser.parse(query)
+        expected = full.parser.parse(query)
+
+        assert [(t["dep"], t["head"]) for t in tokens] == [("ROOT", query)]
+        assert tokens == full.analyze_dependency_tree(query)["tokens"]
+        # Documents compare by identity; their tokens are compared above
+        assert parsed.keys() == expected.keys()
+        assert all(parsed[key] == expected[key] for key in parsed if key != "doc")
+        assert translator.translate_to_sql(query) == full.translate_to_sql(query)
+
+    def test_negated_boolean_condition(self, translator):
+        """Test that "is not true" negates the boolean comparison."""
+        result = translator.translate("list assets where approved is not true")
+        sql = translator.translate_to_sql("list assets where approved is not true")
+
+        assert result["where"] == [
+            {"column": "approved", "operator": "!=", "value": True}
+        ]
+        assert "WHERE approved != TRUE" in sql
+
+    def test_negated_vendor_condition(self, translator):
+        """Test that "vendor is not X" excludes the vendor instead of matching it."""
+        result = translator.translate("Show assets where vendor is not siemens")
+        sql = translator.translate_to_sql("Show assets where vendor is not siemens")
+        vendor_conditions = [c for c in result["where"] if c["column"] == "vendor"]
+
+        assert vendor_conditions
+        assert all(c["operator"] == "!=" for c in vendor_conditions)
+        assert "vendor != 'siemens'" in sql
+        assert "LIKE" not in sql
+
+
+class TestTranslatorBatchTranslation:
+    """Test batched translation of multiple queries."""
+
+    @pytest.fixture
+    def translator(self):
+        """Provide translator instance."""
+        return NLToSQLTranslator()
+
+    def test_translate_many_matches_translate(self, translator):
+        """Test that batched translation matches single-query translation."""
+        queries = [
+            "Show me assets in site 54",
+            "Find approved assets",
+            "How many assets are there?",
+        ]
+
+        results = translator.translate_many(queries)
+
+        assert results == [translator.translate(q) for q in queries]
+
+    def test_translate_many_with_details_structure(self, translator):
+        """Test that batched detailed translation keeps query order and fields."""
+        queries = ["Show me assets in site 54", "Find approved assets"]
+
+        results = translator.translate_many_with_details(queries)
+
+        assert len(results) == 2
+        for query, result in zip(queries, results):
+            assert result["sql"] == translator.translate_to_sql(query)
+            assert "intent" in result
+            assert "entities" in result
+
+    def test_translate_many_tagged_keeps_tags(self, translator):
+        """Test that tagged batch translation pairs each result with its tag."""
+        tagged_queries = [
+            ("Show me assets in site 54", "discovery"),
+            ("Find approved assets", "security"),
+        ]
+
+        results = translator.translate_many_tagged(tagged_queries)
+
+        assert [tag for _, tag in results] == ["discovery", "security"]
+        for (query, _), (result, _) in zip(tagged_queries, results):
+            assert result["sql"] == translator.translate_to_sql(query)
+
+    def test_recognize_many_matches_recognize(self, translator):
+        """Test that batched entity recognition matches per-document recognition."""
+        parser = translator.parser
+        texts = ["Show me assets in site 54", "Find approved assets"]
+
+        results = parser.entity_recognizer.recognize_many(texts)
+
+        assert results == [
+            parser.entity_recognizer.recognize(parser.nlp(text)) for text in texts
+        ]
+
+    def test_recognize_text_keeps_pipeline_intact(self, translator):
+        """Test that single-text recognition does not disable shared components."""
+        parser = translator.parser
+        pipe_names = list(parser.nlp.pipe_names)
+        text = "Show me assets in site 54"
+
+        result = parser.entity_recognizer.recognize_text(text)
+
+        assert result == parser.entity_recognizer.recognize(parser.nlp(text))
+        assert parser.nlp.pipe_names == pipe_names
+
+    def test_translate_many_empty(self, translator):
+        """Test batched translation of no queries."""
+        assert translator.translate_many([]) == []
+
+
+class TestTranslatorCache:
+    """Test caching of translations by query string."""
+
+    @pytest.fixture
+    def translator(self):
+        """Provide translator instance."""
+        return NLToSQLTranslator()
+
+    def test_cached_result_not_affected_by_caller_mutation(self, translator):
+        """Test that mutating a returned result does not leak into the cache."""
+        query = "Show me assets in site 54"
+
+        first = translator.translate(query)
+        expected = copy.deepcopy(first)
+        first["where"].append({"column": "site", "operator": "=", "value": 1})
+
+        assert translator.translate(query) == expected
+
+    def test_cache_size_limit(self, monkeypatch):
+        """Test that the least recently used translation is evicted."""
+        translator = NLToSQLTranslator(cache_size=1)
+        parse = translator.parser.parse
+        parsed = []
+
+        def counting_parse(query):
+            parsed.append(query)
+            return parse(query)
+
+        monkeypatch.setattr(translator.parser, "parse", counting_parse)
+
+        translator.translate("Show me assets in site 54")
+        translator.translate("Find approved assets")
+        translator.translate("Find approved assets")
+        translator.translate("Show me assets in site 54")
+
+        assert parsed == [
+            "Show me assets in site 54",
+            "Find approved assets",
+            "Show me assets in site 54",
+        ]
+
+
+class TestDependencyPathOperators:
+    """Test operator inference along dependency paths of fixed parses."""
+
+    @pytest.fixture
+    def translator(self):
+        """Provide translator instance."""
+        return NLToSQLTranslator()
+
+    @staticmethod
+    def _make_doc(translator, words, heads, deps, pos):
+        """Build a document with a fixed dependency parse."""
+        return Doc(
+            translator.parser.nlp.vocab, words=words, heads=heads, deps=deps, pos=pos
+        )
+
+    def test_with_preposition_above_meeting_point_gives_like(self, translator):
+        """Test that "with" above where both chains meet still selects LIKE."""
+        doc = self._make_doc(
+            translator,
+            words=["Show", "assets", "with", "IP", "192.168.1.1"],
+            heads=[0, 0, 0, 4, 2],
+            deps=["ROOT", "dobj", "prep", "compound", "pobj"],
+            pos=["VERB", "NOUN", "ADP", "NOUN", "NUM"],
+        )
+        parser = translator.parser
+
+        path = DependencyPathFinder().find_path(doc[3], doc[4])
+        operator = parser._infer_operator_from_dependency(
+            doc[3], doc[4], doc, {"operators": []}, "ipv4"
+        )
+
+        assert [t.text for t in path] == [
+            "IP", "192.168.1.1", "with", "Show", "with", "192.168.1.1"
+        ]
+        assert operator == "LIKE"
+
+    def test_has_root_gives_like(self, translator):
+        """Test that a "has" root above the column and value selects LIKE."""
+        doc = self._make_doc(
+            translator,
+            words=["Has", "the", "active", "task", "cleanup", "been", "running", "?"],
+            heads=[0, 4, 4, 4, 0, 6, 0, 0],
+            deps=["ROOT", "det", "amod", "compound", "nsubj", "aux", "ccomp", "punct"],
+            pos=["AUX", "DET", "ADJ", "NOUN", "NOUN", "AUX", "VERB", "PUNCT"],
+        )
+        parser = translator.parser
+
+        path = DependencyPathFinder().find_path(doc[3], doc[4])
+        operator = parser._infer_operator_from_dependency(
+            doc[3], doc[4], doc, {"operators": []}, "active_tasks"
+        )
+
+        assert [t.text for t in path] == ["task", "cleanup", "Has", "cleanup"]
+        assert operator == "LIKE"
+
+
+ENVIRONMENT_SETTINGS = [
+    ("NL2SQL_BATCH_SIZE", "NLP_BATCH_SIZE", 32),
+    ("NL2SQL_N_PROCESS", "NLP_N_PROCESS", 1),
+]
+
+
+class TestEnvironmentSettings:
+    """Test settings read from environment variables."""
+
+    @pytest.fixture(autouse=True)
+    def reload_constants(self):
+        """Reload the constants from the unpatched environment afterwards."""
+        yield
+        importlib.reload(constants)
+
+    @pytest.mark.parametrize("variable, name, default", ENVIRONMENT_SETTINGS)
+    @pytest.mark.parametrize("value", ["0", "-3", "abc"])
+    def test_invalid_value_falls_back_to_default(
+        self, monkeypatch, variable, name, default, value
+    ):
+        """Test that an invalid value warns and leaves the default in place."""
+        monkeypatch.setenv(variable, value)
+
+        with pytest.warns(UserWarning, match=variable):
+            importlib.reload(constants)
+
+        assert getattr(constants, name) == default
+
+    @pytest.mark.parametrize("variable, name, default", ENVIRONMENT_SETTINGS)
+    def test_valid_value_is_used(self, monkeypatch, variable, name, default):
+        """Test that a positive integer overrides the default."""
+        monkeypatch.setenv(variable, "4")
+
+        importlib.reload(constants)
+
+        assert getattr(constants, name) == 4